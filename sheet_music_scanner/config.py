@@ -7,9 +7,10 @@ and user preferences.
 
 import os
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Optional
+from typing import Iterator, Optional
 import platform
 
 
@@ -78,6 +79,7 @@ class OMRConfig:
     use_gpu: bool = True
     deskew_enabled: bool = True
     contrast_enhancement: bool = True
+    batch_workers: int = 1  # Files recognized at once in batch mode
 
 
 @dataclass
@@ -100,6 +102,7 @@ class GUIConfig:
     window_height: int = 900
     show_toolbar: bool = True
     show_statusbar: bool = True
+    show_batch_summary_dialog: bool = True  # Pop up a summary after batch runs
 
 
 @dataclass
@@ -126,6 +129,9 @@ class Config:
     _config_dir: Path = field(default_factory=lambda: Path.home() / ".sheet_music_scanner")
     _config_file: Path = field(default=None)
     
+    # True inside batch_update(): save() is deferred to the end of the block
+    _suspend_save: bool = field(default=False, init=False, repr=False)
+    
     def __post_init__(self):
         """Initialize configuration paths."""
         self._config_dir.mkdir(parents=True, exist_ok=True)
@@ -147,7 +153,10 @@ class Config:
         return cache
     
     def save(self) -> None:
-        """Save configuration to disk."""
+        """Save configuration to disk (deferred inside batch_update())."""
+        if self._suspend_save:
+            return
+        
         data = {
             "lilypond_path": self.lilypond_path,
             "musescore_path": self.musescore_path,
@@ -160,6 +169,29 @@ class Config:
         with open(self._config_file, "w") as f:
             json.dump(data, f, indent=2)
     
+    @contextmanager
+    def batch_update(self) -> Iterator["Config"]:
+        """
+        Group several changes into a single write to disk.
+        
+        save() calls inside the block are skipped and the configuration
+        is saved once on exit. Nested blocks save only when the
+        outermost one exits.
+        
+        Yields:
+            This configuration
+        """
+        if self._suspend_save:
+            yield self
+            return
+        
+        self._suspend_save = True
+        try:
+            yield self
+        finally:
+            self._suspend_save = False
+        self.save()
+    
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from disk or create default."""
@@ -6,6 +6,7 @@ Provides batch OMR processing, batch export, and progress tracking.
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import queue
 import time
@@ -18,6 +19,12 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _omr_runs_in_process() -> bool:
+    """Check whether OMR would run inside this process (oemer as a library)."""
+    from sheet_music_scanner.omr.oemer_adapter import OemerAdapter
+    return OemerAdapter().is_available()
+
+
 class BatchJobStatus(Enum):
     """Status of a batch job item."""
     PENDING = "pending"
@@ -37,6 +44,11 @@ class BatchJobItem:
     error_message: Optional[str] = None
     result: Any = None
     processing_time: float = 0.0
+    display_name: str = field(init=False, default="")
+    
+    def __post_init__(self):
+        # Computed once so progress updates only handle strings
+        self.display_name = self.input_path.name
 
 
 @dataclass
@@ -109,15 +121,50 @@ class BatchProcessor:
         self._item_completed_callback = on_item_completed
         self._job_completed_callback = on_job_completed
     
-    def add_files(self, files: List[Path]) -> None:
+    def add_files(self, files: List[Path], validate: bool = True) -> None:
         """
         Add files to process.
         
+        Missing files are still queued, so item indices match the input
+        list, but are marked FAILED up front and never reach the engine.
+        
         Args:
             files: List of file paths
+            validate: Check that each file exists. Pass False for paths
+                that were just listed from the filesystem (e.g. by a
+                directory scan) to skip one stat call per file.
         """
         for f in files:
-            self._items.append(BatchJobItem(input_path=f))
+            item = BatchJobItem(input_path=f)
+            if validate and not f.is_file():
+                item.status = BatchJobStatus.FAILED
+                item.error_message = f"File not found: {f}"
+            self._items.append(item)
+    
+    def remove_items(self, indices: List[int]) -> None:
+        """
+        Remove items by index.
+        
+        Args:
+            indices: Positions of the items to remove
+        """
+        for i in sorted(set(indices), reverse=True):
+            del self._items[i]
+    
+    def requeue(self, validate: bool = True) -> None:
+        """
+        Reset all items to PENDING so the batch can be run again.
+        
+        Args:
+            validate: Re-check that each file exists, so files that were
+                missing at add time are retried once they reappear
+        """
+        for i, item in enumerate(self._items):
+            fresh = BatchJobItem(input_path=item.input_path, output_path=item.output_path)
+            if validate and not item.input_path.is_file():
+                fresh.status = BatchJobStatus.FAILED
+                fresh.error_message = f"File not found: {item.input_path}"
+            self._items[i] = fresh
     
     def set_output_directory(self, output_dir: Path, format_ext: str = ".musicxml") -> None:
         """
@@ -155,86 +202,132 @@ class BatchProcessor:
         self._is_running = True
         self._cancel_requested = False
         
-        def run():
-            start_time = time.time()
-            completed = 0
-            failed = 0
-            cancelled = 0
-            
-            from sheet_music_scanner.omr.processor import OMRProcessor, OMREngine
-            
-            processor = OMRProcessor(engine=OMREngine.OEMER)
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._run_omr(self.max_workers)),
+            daemon=True,
+        )
+        self._thread.start()
+    
+    async def process_omr_async(self, concurrency: Optional[int] = None) -> BatchJobResult:
+        """
+        Run batch OMR processing as a coroutine.
+        
+        Each file is recognized in a worker thread via asyncio.to_thread.
+        Files overlap only while the engine runs as a separate oemer
+        process; when oemer is imported as a library its inference would
+        share this process, so files are then processed one at a time.
+        
+        Args:
+            concurrency: Files processed at once (default: max_workers)
             
-            for i, item in enumerate(self._items):
+        Returns:
+            Result of the batch job
+        """
+        if self._is_running:
+            raise RuntimeError("Batch job already running")
+        
+        self._is_running = True
+        self._cancel_requested = False
+        return await self._run_omr(concurrency or self.max_workers)
+    
+    async def _run_omr(self, concurrency: int) -> BatchJobResult:
+        """Process all items with at most `concurrency` running at once."""
+        start_time = time.time()
+        
+        # Library-mode oemer runs inference inside this process, where
+        # concurrent runs are not isolated from each other
+        if concurrency > 1 and _omr_runs_in_process():
+            logger.info("oemer runs in-process; processing batch serially")
+            concurrency = 1
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        # One OMRProcessor per worker thread: its progress callback is
+        # per-item state
+        local = threading.local()
+        
+        def process_one(i: int, item: BatchJobItem) -> None:
+            processor = getattr(local, "processor", None)
+            if processor is None:
+                from sheet_music_scanner.omr.processor import OMRProcessor, OMREngine
+                processor = local.processor = OMRProcessor(engine=OMREngine.OEMER)
+            self._process_omr_item(processor, i, item)
+        
+        async def run_item(i: int, item: BatchJobItem) -> None:
+            async with semaphore:
                 if self._cancel_requested:
                     item.status = BatchJobStatus.CANCELLED
-                    cancelled += 1
-                    continue
-                
-                item.status = BatchJobStatus.PROCESSING
-                item_start = time.time()
-                
-                if self._item_started_callback:
-                    self._item_started_callback(i, item)
-                
-                try:
-                    # Set up progress callback
-                    def on_progress(msg, pct):
-                        item.progress = pct
-                        if self._item_progress_callback:
-                            self._item_progress_callback(i, pct)
-                    
-                    processor.progress_callback = on_progress
-                    
-                    # Process the image
-                    if item.input_path.suffix.lower() == '.pdf':
-                        result = processor.process_pdf(item.input_path)
-                    else:
-                        result = processor.process_image(item.input_path)
-                    
-                    if result.success and result.score:
-                        item.result = result.score
-                        item.status = BatchJobStatus.COMPLETED
-                        
-                        # Export if output path set
-                        if item.output_path:
-                            result.score.to_musicxml(item.output_path)
-                        
-                        completed += 1
-                    else:
-                        item.status = BatchJobStatus.FAILED
-                        item.error_message = result.error_message
-                        failed += 1
-                
-                except Exception as e:
-                    item.status = BatchJobStatus.FAILED
-                    item.error_message = str(e)
-                    failed += 1
-                    logger.exception(f"Batch OMR failed for {item.input_path}")
-                
-                item.processing_time = time.time() - item_start
-                item.progress = 100
-                
-                if self._item_completed_callback:
-                    self._item_completed_callback(i, item)
+                    return
+                if item.status == BatchJobStatus.FAILED:
+                    # Rejected by add_files; report it without the engine
+                    if self._item_completed_callback:
+                        self._item_completed_callback(i, item)
+                    return
+                await asyncio.to_thread(process_one, i, item)
+        
+        try:
+            await asyncio.gather(*(run_item(i, item) for i, item in enumerate(self._items)))
+        finally:
+            self._is_running = False
+        
+        statuses = [item.status for item in self._items]
+        result = BatchJobResult(
+            total_items=len(self._items),
+            completed=statuses.count(BatchJobStatus.COMPLETED),
+            failed=statuses.count(BatchJobStatus.FAILED),
+            cancelled=statuses.count(BatchJobStatus.CANCELLED),
+            total_time=time.time() - start_time,
+            items=self._items.copy(),
+        )
+        
+        if self._job_completed_callback:
+            self._job_completed_callback(result)
+        
+        return result
+    
+    def _process_omr_item(self, processor: Any, i: int, item: BatchJobItem) -> None:
+        """Recognize (and optionally export) one item (worker thread)."""
+        item.status = BatchJobStatus.PROCESSING
+        item_start = time.time()
+        
+        if self._item_started_callback:
+            self._item_started_callback(i, item)
+        
+        try:
+            # Set up progress callback
+            def on_progress(msg, pct):
+                item.progress = pct
+                if self._item_progress_callback:
+                    self._item_progress_callback(i, pct)
             
-            # Create result
-            result = BatchJobResult(
-                total_items=len(self._items),
-                completed=completed,
-                failed=failed,
-                cancelled=cancelled,
-                total_time=time.time() - start_time,
-                items=self._items.copy(),
-            )
+            processor.progress_callback = on_progress
             
-            self._is_running = False
+            # Process the image
+            if item.input_path.suffix.lower() == '.pdf':
+                result = processor.process_pdf(item.input_path)
+            else:
+                result = processor.process_image(item.input_path)
             
-            if self._job_completed_callback:
-                self._job_completed_callback(result)
+            if result.success and result.score:
+                item.result = result.score
+                item.status = BatchJobStatus.COMPLETED
+                
+                # Export if output path set
+                if item.output_path:
+                    result.score.to_musicxml(item.output_path)
+            else:
+                item.status = BatchJobStatus.FAILED
+                item.error_message = result.error_message
         
-        self._thread = threading.Thread(target=run, daemon=True)
-        self._thread.start()
+        except Exception as e:
+            item.status = BatchJobStatus.FAILED
+            item.error_message = str(e)
+            logger.exception(f"Batch OMR failed for {item.input_path}")
+        
+        item.processing_time = time.time() - item_start
+        item.progress = 100
+        
+        if self._item_completed_callback:
+            self._item_completed_callback(i, item)
     
     def process_export(
         self,
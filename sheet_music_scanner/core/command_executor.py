@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import Optional
 import logging
+import re
 
 from music21 import (
     note, chord, stream, pitch, key, meter, tempo,
@@ -53,6 +54,9 @@ class CommandExecutor:
         "soprano": clef.SopranoClef,
     }
     
+    # First number in a tempo value such as "120 bpm"
+    _TEMPO_NUMBER_RE = re.compile(r'(\d+)')
+    
     def __init__(self):
         self._pending_tie: Optional[note.Note] = None
     
@@ -163,6 +167,9 @@ class CommandExecutor:
         
         target_part = score._score.parts[part_index]
         
+        # Record this as an undoable operation
+        score._save_undo_state()
+        
         if not append:
             # Clear existing content
             target_part.clear()
@@ -196,8 +203,8 @@ class CommandExecutor:
                 target_part.insert(current_offset, m21_elem)
                 current_offset += m21_elem.duration.quarterLength
         
-        # Record this as an undoable operation
-        score._push_undo_state()
+        # The part was edited in place; drop the score's derived caches
+        score._mark_modified()
     
     def _create_music_element(
         self, 
@@ -350,8 +357,7 @@ class CommandExecutor:
         """Parse a tempo value like '120' or '120 bpm'."""
         try:
             # Extract number
-            import re
-            match = re.search(r'(\d+)', value)
+            match = self._TEMPO_NUMBER_RE.search(value)
             if match:
                 bpm = int(match.group(1))
                 return tempo.MetronomeMark(number=bpm)
@@ -7,7 +7,7 @@ including loading, editing, and exporting functionality.
 
 from __future__ import annotations
 
-import copy
+import zlib
 from pathlib import Path
 from typing import Optional, List, Iterator, Tuple, Union
 from dataclasses import dataclass, field
@@ -15,6 +15,7 @@ import tempfile
 
 from music21 import (
     converter,
+    freezeThaw,
     stream,
     note,
     chord,
@@ -28,8 +29,41 @@ from music21 import (
 )
 from music21.midi import translate as midi_translate
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore
+    ZSTD_AVAILABLE = False
 
-@dataclass
+
+# Undo history budget for compressed snapshots
+DEFAULT_MAX_UNDO_BYTES = 64 * 1024 * 1024
+
+
+def _compress_snapshot(music21_score: stream.Score) -> bytes:
+    """Pickle and compress a score for the undo/redo stacks."""
+    # A live score holds weakrefs (active sites, element trees) that plain
+    # pickle cannot restore; the freezer deep-copies the score and records
+    # its sites so the thawer can rebuild them.
+    data = freezeThaw.StreamFreezer(music21_score).writeStr(fmt='pickle')
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=1).compress(data)
+    return zlib.compress(data, 1)
+
+
+def _restore_snapshot(snapshot: bytes) -> stream.Score:
+    """Restore a score saved with _compress_snapshot."""
+    if ZSTD_AVAILABLE:
+        data = zstandard.ZstdDecompressor().decompress(snapshot)
+    else:
+        data = zlib.decompress(snapshot)
+    thawer = freezeThaw.StreamThawer()
+    thawer.openStr(data, pickleFormat='pickle')
+    return thawer.stream
+
+
+@dataclass(slots=True)
 class NoteInfo:
     """Information about a single note for display/editing."""
     
@@ -45,11 +79,22 @@ class NoteInfo:
     is_chord: bool = False
     chord_pitches: List[str] = field(default_factory=list)
     
-    # Internal reference for editing
+    # Internal reference for editing; stable across undo/redo, see
+    # Score._find_by_key
     _element_id: Optional[int] = None
 
 
-@dataclass
+def _element_key(
+    part_index: int,
+    measure_number: int,
+    offset: float,
+    pitch: str
+) -> int:
+    """Build a NoteInfo key that survives deep copies of the score."""
+    return hash((part_index, measure_number, round(offset * 1000), pitch))
+
+
+@dataclass(slots=True)
 class MeasureInfo:
     """Information about a measure."""
     
@@ -60,7 +105,7 @@ class MeasureInfo:
     notes: List[NoteInfo] = field(default_factory=list)
 
 
-@dataclass  
+@dataclass(slots=True)
 class PartInfo:
     """Information about a part/instrument."""
     
@@ -81,6 +126,19 @@ class Score:
     - Undo/redo functionality
     """
     
+    __slots__ = (
+        "_score",
+        "_source_path",
+        "_is_modified",
+        "_undo_stack",
+        "_redo_stack",
+        "_undo_bytes",
+        "_max_undo_bytes",
+        "_note_index",
+        "_note_count",
+        "_musicxml_bytes",
+    )
+    
     def __init__(self, music21_score: Optional[stream.Score] = None):
         """
         Initialize Score wrapper.
@@ -92,10 +150,18 @@ class Score:
         self._source_path: Optional[Path] = None
         self._is_modified: bool = False
         
-        # Undo/redo stacks
-        self._undo_stack: List[stream.Score] = []
-        self._redo_stack: List[stream.Score] = []
-        self._max_undo: int = 50
+        # Undo/redo stacks of compressed snapshots, capped by total size
+        self._undo_stack: List[bytes] = []
+        self._redo_stack: List[bytes] = []
+        self._undo_bytes: int = 0
+        self._max_undo_bytes: int = DEFAULT_MAX_UNDO_BYTES
+        
+        # NoteInfo lookup by _element_id, built lazily
+        self._note_index: Optional[dict[int, NoteInfo]] = None
+        self._note_count: Optional[int] = None
+        
+        # Serialized MusicXML, built lazily
+        self._musicxml_bytes: Optional[bytes] = None
     
     @classmethod
     def from_musicxml(cls, filepath: Union[str, Path]) -> "Score":
@@ -213,6 +279,13 @@ class Score:
             return len(measures)
         return 0
     
+    @property
+    def note_count(self) -> int:
+        """Get the number of notes and chords (cached until modified)."""
+        if self._note_count is None:
+            self._note_count = len(self._score.recurse().notes)
+        return self._note_count
+    
     @property
     def key_signature(self) -> Optional[str]:
         """Get the key signature of the score."""
@@ -258,15 +331,24 @@ class Score:
     
     def _save_undo_state(self) -> None:
         """Save current state for undo."""
-        self._undo_stack.append(copy.deepcopy(self._score))
-        if len(self._undo_stack) > self._max_undo:
-            self._undo_stack.pop(0)
+        self._push_undo_snapshot(_compress_snapshot(self._score))
         # Clear redo stack on new action
         self._redo_stack.clear()
     
+    def _push_undo_snapshot(self, snapshot: bytes) -> None:
+        """Push a snapshot, evicting the oldest ones over the byte budget."""
+        self._undo_stack.append(snapshot)
+        self._undo_bytes += len(snapshot)
+        # Always keep the newest snapshot, even if it alone exceeds the budget
+        while self._undo_bytes > self._max_undo_bytes and len(self._undo_stack) > 1:
+            self._undo_bytes -= len(self._undo_stack.pop(0))
+    
     def _mark_modified(self) -> None:
         """Mark the score as modified."""
         self._is_modified = True
+        self._note_index = None
+        self._note_count = None
+        self._musicxml_bytes = None
     
     def undo(self) -> bool:
         """
@@ -279,11 +361,13 @@ class Score:
             return False
         
         # Save current state to redo stack
-        self._redo_stack.append(copy.deepcopy(self._score))
+        self._redo_stack.append(_compress_snapshot(self._score))
         
         # Restore previous state
-        self._score = self._undo_stack.pop()
-        self._is_modified = True
+        snapshot = self._undo_stack.pop()
+        self._undo_bytes -= len(snapshot)
+        self._score = _restore_snapshot(snapshot)
+        self._mark_modified()
         return True
     
     def redo(self) -> bool:
@@ -297,11 +381,11 @@ class Score:
             return False
         
         # Save current state to undo stack
-        self._undo_stack.append(copy.deepcopy(self._score))
+        self._push_undo_snapshot(_compress_snapshot(self._score))
         
         # Restore redo state
-        self._score = self._redo_stack.pop()
-        self._is_modified = True
+        self._score = _restore_snapshot(self._redo_stack.pop())
+        self._mark_modified()
         return True
     
     def can_undo(self) -> bool:
@@ -435,49 +519,9 @@ class Score:
             return notes
         
         for element in measure.notesAndRests:
-            if isinstance(element, note.Rest):
-                note_info = NoteInfo(
-                    part_index=part_index,
-                    measure_number=measure_number,
-                    beat=element.beat,
-                    pitch="rest",
-                    midi_pitch=0,
-                    duration=element.quarterLength,
-                    duration_type=element.duration.type,
-                    is_rest=True,
-                    _element_id=id(element),
-                )
-            elif isinstance(element, chord.Chord):
-                pitches = [p.nameWithOctave for p in element.pitches]
-                note_info = NoteInfo(
-                    part_index=part_index,
-                    measure_number=measure_number,
-                    beat=element.beat,
-                    pitch=pitches[0] if pitches else "",
-                    midi_pitch=element.pitches[0].midi if element.pitches else 0,
-                    duration=element.quarterLength,
-                    duration_type=element.duration.type,
-                    lyric=element.lyric if hasattr(element, 'lyric') else None,
-                    is_chord=True,
-                    chord_pitches=pitches,
-                    _element_id=id(element),
-                )
-            elif isinstance(element, note.Note):
-                note_info = NoteInfo(
-                    part_index=part_index,
-                    measure_number=measure_number,
-                    beat=element.beat,
-                    pitch=element.nameWithOctave,
-                    midi_pitch=element.pitch.midi,
-                    duration=element.quarterLength,
-                    duration_type=element.duration.type,
-                    lyric=element.lyric,
-                    _element_id=id(element),
-                )
-            else:
-                continue
-            
-            notes.append(note_info)
+            note_info = self._make_note_info(element, part_index, measure_number)
+            if note_info is not None:
+                notes.append(note_info)
         
         return notes
     
@@ -485,17 +529,108 @@ class Score:
         """
         Iterate over all notes in the score.
         
+        Walks each part once with ``recurse()`` instead of looking up every
+        measure again by number.
+        
         Yields:
             NoteInfo objects for each note
         """
         for part_index, part in enumerate(self._score.parts):
-            for measure in part.getElementsByClass(stream.Measure):
-                for note_info in self.get_notes_in_measure(
-                    part_index, 
-                    measure.measureNumber
-                ):
+            current_measure = None
+            measure_number = 0
+            
+            for element in part.recurse().notesAndRests:
+                site = element.activeSite
+                if site is not current_measure:
+                    # Match get_notes_in_measure: direct measure contents only
+                    if not isinstance(site, stream.Measure):
+                        continue
+                    current_measure = site
+                    measure_number = site.measureNumber
+                
+                note_info = self._make_note_info(element, part_index, measure_number)
+                if note_info is not None:
                     yield note_info
     
+    @staticmethod
+    def _make_note_info(
+        element: note.GeneralNote,
+        part_index: int,
+        measure_number: int
+    ) -> Optional[NoteInfo]:
+        """
+        Build a NoteInfo for a note, chord or rest.
+        
+        Returns:
+            NoteInfo, or None for unsupported element types
+        """
+        if isinstance(element, note.Rest):
+            return NoteInfo(
+                part_index=part_index,
+                measure_number=measure_number,
+                beat=element.beat,
+                pitch="rest",
+                midi_pitch=0,
+                duration=element.quarterLength,
+                duration_type=element.duration.type,
+                is_rest=True,
+                _element_id=_element_key(
+                    part_index, measure_number, element.offset, "rest"
+                ),
+            )
+        if isinstance(element, chord.Chord):
+            pitches = [p.nameWithOctave for p in element.pitches]
+            pitch = pitches[0] if pitches else ""
+            return NoteInfo(
+                part_index=part_index,
+                measure_number=measure_number,
+                beat=element.beat,
+                pitch=pitch,
+                midi_pitch=element.pitches[0].midi if element.pitches else 0,
+                duration=element.quarterLength,
+                duration_type=element.duration.type,
+                lyric=element.lyric if hasattr(element, 'lyric') else None,
+                is_chord=True,
+                chord_pitches=pitches,
+                _element_id=_element_key(
+                    part_index, measure_number, element.offset, pitch
+                ),
+            )
+        if isinstance(element, note.Note):
+            return NoteInfo(
+                part_index=part_index,
+                measure_number=measure_number,
+                beat=element.beat,
+                pitch=element.nameWithOctave,
+                midi_pitch=element.pitch.midi,
+                duration=element.quarterLength,
+                duration_type=element.duration.type,
+                lyric=element.lyric,
+                _element_id=_element_key(
+                    part_index, measure_number, element.offset, element.nameWithOctave
+                ),
+            )
+        return None
+    
+    def _find_by_key(self, element_key: int) -> Optional[NoteInfo]:
+        """
+        Re-resolve a note by its NoteInfo._element_id.
+        
+        Keys are derived from part, measure, position and pitch, so they
+        still match after undo/redo restores a copied score.
+        
+        Args:
+            element_key: Value of NoteInfo._element_id
+            
+        Returns:
+            Current NoteInfo for that key, or None if it no longer exists
+        """
+        if self._note_index is None:
+            self._note_index = {
+                note_info._element_id: note_info for note_info in self.iter_notes()
+            }
+        return self._note_index.get(element_key)
+    
     def set_note_pitch(
         self,
         part_index: int,
@@ -610,10 +745,35 @@ class Score:
         Returns:
             MusicXML string
         """
+        return self.to_musicxml_bytes().decode('utf-8')
+    
+    def to_musicxml_bytes(self) -> bytes:
+        """
+        Get MusicXML representation as UTF-8 encoded bytes.
+        
+        Serializes in memory, without a file or a str round trip.
+        
+        Returns:
+            MusicXML document bytes
+        """
         from music21.musicxml import m21ToXml
         
         exporter = m21ToXml.GeneralObjectExporter(self._score)
-        return exporter.parse().decode('utf-8')
+        return exporter.parse()
+    
+    @property
+    def musicxml_bytes(self) -> bytes:
+        """
+        MusicXML bytes for the current state of the score.
+        
+        Serialized once and reused until _mark_modified() runs, so it is
+        only as fresh as the edits that went through the Score API. The
+        PDF exporter serializes each export itself instead, keeping its
+        cache key and renderer input in step.
+        """
+        if self._musicxml_bytes is None:
+            self._musicxml_bytes = self.to_musicxml_bytes()
+        return self._musicxml_bytes
     
     def get_duration_seconds(self) -> float:
         """
@@ -7,17 +7,69 @@ Piano Score, SATB Choir, etc.
 
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass, asdict
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 from enum import Enum
 import logging
 
-from music21 import stream, clef, meter, key, tempo, instrument
+# music21 is imported where scores are built so that browsing templates
+# does not pay for it
+if TYPE_CHECKING:
+    from music21 import stream
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Clef name -> music21.clef class name (instantiated per part)
+_CLEF_CLASS_NAMES = {
+    "treble": "TrebleClef",
+    "bass": "BassClef",
+    "alto": "AltoClef",
+    "tenor": "TenorClef",
+}
+
+# Instrument name -> music21.instrument class, None if unknown
+_INSTRUMENT_CACHE: Dict[str, Optional[type]] = {}
+
+
+def _resolve_instrument(name: str) -> Optional[type]:
+    """Look up a music21 instrument class by name, caching the result."""
+    try:
+        return _INSTRUMENT_CACHE[name]
+    except KeyError:
+        from music21 import instrument
+        
+        instr_class = getattr(instrument, name, None)
+        _INSTRUMENT_CACHE[name] = instr_class
+        return instr_class
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_key_signature(signature: str) -> Tuple[str, Optional[str]]:
+    """
+    Resolve a key string like "Bb major" to (tonic, mode) for key.Key.
+    
+    Validated once per distinct string; unknown keys fall back to C major.
+    """
+    from music21 import key
+    
+    tonic, _, mode = signature.strip().partition(" ")
+    try:
+        key.Key(tonic, mode or None)
+    except Exception:
+        return "C", "major"
+    return tonic, mode or None
+
 
 class TemplateCategory(Enum):
     """Template categories."""
@@ -29,7 +81,7 @@ class TemplateCategory(Enum):
     CUSTOM = "Custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class PartTemplate:
     """Template for a single part/staff."""
     name: str
@@ -39,14 +91,27 @@ class PartTemplate:
     transpose: int = 0  # Transposition in semitones
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "clef": self.clef,
+            "instrument": self.instrument,
+            "midi_program": self.midi_program,
+            "transpose": self.transpose,
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'PartTemplate':
-        return cls(**data)
+        # Positional arguments skip building a kwargs dict per part
+        return cls(
+            data["name"],
+            data.get("clef", "treble"),
+            data.get("instrument", ""),
+            data.get("midi_program", 0),
+            data.get("transpose", 0),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreTemplate:
     """Template for a complete score."""
     name: str
@@ -77,29 +142,36 @@ class ScoreTemplate:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'ScoreTemplate':
-        parts = [PartTemplate.from_dict(p) for p in data.get("parts", [])]
+        # Positional construction; this runs once per template when
+        # loading the custom library
+        part_from_dict = PartTemplate.from_dict
+        parts = [part_from_dict(p) for p in data.get("parts", [])]
         return cls(
-            name=data["name"],
-            description=data.get("description", ""),
-            category=TemplateCategory(data.get("category", "Custom")),
-            time_signature=data.get("time_signature", "4/4"),
-            key_signature=data.get("key_signature", "C major"),
-            tempo_bpm=data.get("tempo_bpm", 120),
-            parts=parts,
-            is_builtin=data.get("is_builtin", False),
+            data["name"],
+            data.get("description", ""),
+            TemplateCategory(data.get("category", "Custom")),
+            data.get("time_signature", "4/4"),
+            data.get("key_signature", "C major"),
+            data.get("tempo_bpm", 120),
+            parts,
+            data.get("is_builtin", False),
         )
     
     def create_score(self) -> stream.Score:
         """Create a music21 Score from this template."""
+        from music21 import stream, clef, meter, key, tempo, metadata
+        
         s = stream.Score()
         
         # Set metadata
-        s.metadata = stream.metadata.Metadata()
+        s.metadata = metadata.Metadata()
         s.metadata.title = self.name
         
         # Add tempo
         mm = tempo.MetronomeMark(number=self.tempo_bpm)
         
+        key_tonic, key_mode = _parse_key_signature(self.key_signature)
+        
         # Add parts
         for part_template in self.parts:
             p = stream.Part()
@@ -108,7 +180,7 @@ class ScoreTemplate:
             # Set instrument
             if part_template.instrument:
                 try:
-                    instr_class = getattr(instrument, part_template.instrument, None)
+                    instr_class = _resolve_instrument(part_template.instrument)
                     if instr_class:
                         p.insert(0, instr_class())
                 except Exception:
@@ -118,23 +190,14 @@ class ScoreTemplate:
             m = stream.Measure(number=1)
             
             # Add clef
-            clef_map = {
-                "treble": clef.TrebleClef(),
-                "bass": clef.BassClef(),
-                "alto": clef.AltoClef(),
-                "tenor": clef.TenorClef(),
-            }
-            m.append(clef_map.get(part_template.clef, clef.TrebleClef()))
+            clef_class = getattr(clef, _CLEF_CLASS_NAMES.get(part_template.clef, "TrebleClef"))
+            m.append(clef_class())
             
             # Add time signature
             m.append(meter.TimeSignature(self.time_signature))
             
-            # Add key signature
-            try:
-                ks = key.Key(self.key_signature)
-                m.append(ks)
-            except Exception:
-                m.append(key.Key('C'))
+            # Add key signature (each measure needs its own instance)
+            m.append(key.Key(key_tonic, key_mode))
             
             # Add tempo to first part only
             if len(s.parts) == 0:
@@ -146,8 +209,8 @@ class ScoreTemplate:
         return s
 
 
-# Built-in templates
-BUILTIN_TEMPLATES = [
+# Built-in templates (shared by every TemplateManager, never mutated)
+BUILTIN_TEMPLATES: Tuple[ScoreTemplate, ...] = (
     ScoreTemplate(
         name="Blank Score",
         description="Empty single-staff score",
@@ -239,7 +302,7 @@ BUILTIN_TEMPLATES = [
             PartTemplate(name="Tenor Sax", clef="treble", instrument="TenorSaxophone", transpose=-2),
         ]
     ),
-]
+)
 
 
 class TemplateManager:
@@ -260,8 +323,15 @@ class TemplateManager:
         Args:
             custom_templates_dir: Directory for user templates
         """
-        self._builtin = BUILTIN_TEMPLATES.copy()
-        self._custom: List[ScoreTemplate] = []
+        self._builtin = BUILTIN_TEMPLATES
+        # Custom templates keyed by lowercased name
+        self._custom: Dict[str, ScoreTemplate] = {}
+        self._all_cache: Optional[Tuple[ScoreTemplate, ...]] = None
+        self._name_index: Optional[Dict[str, ScoreTemplate]] = None
+        self._category_index: Optional[Dict[TemplateCategory, Tuple[ScoreTemplate, ...]]] = None
+        # Bumped whenever the template set changes, so views can tell when
+        # their copy is stale
+        self._revision = 0
         self._custom_dir = custom_templates_dir
         
         if self._custom_dir:
@@ -269,30 +339,44 @@ class TemplateManager:
             self._load_custom_templates()
     
     @property
-    def all_templates(self) -> List[ScoreTemplate]:
+    def all_templates(self) -> Tuple[ScoreTemplate, ...]:
         """Get all templates (builtin + custom)."""
-        return self._builtin + self._custom
+        if self._all_cache is None:
+            self._all_cache = self._builtin + tuple(self._custom.values())
+        return self._all_cache
+    
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever templates are added or removed."""
+        return self._revision
     
     @property
     def builtin_templates(self) -> List[ScoreTemplate]:
         """Get built-in templates."""
-        return self._builtin.copy()
+        return list(self._builtin)
     
     @property
     def custom_templates(self) -> List[ScoreTemplate]:
         """Get custom templates."""
-        return self._custom.copy()
+        return list(self._custom.values())
     
     def get_by_category(self, category: TemplateCategory) -> List[ScoreTemplate]:
         """Get templates in a category."""
-        return [t for t in self.all_templates if t.category == category]
+        if self._category_index is None:
+            groups: Dict[TemplateCategory, List[ScoreTemplate]] = {}
+            for t in self.all_templates:
+                groups.setdefault(t.category, []).append(t)
+            self._category_index = {cat: tuple(ts) for cat, ts in groups.items()}
+        return list(self._category_index.get(category, ()))
     
     def get_by_name(self, name: str) -> Optional[ScoreTemplate]:
         """Get a template by name."""
-        for t in self.all_templates:
-            if t.name.lower() == name.lower():
-                return t
-        return None
+        if self._name_index is None:
+            # Reversed so the first template with a given name wins
+            self._name_index = {
+                t.name.lower(): t for t in reversed(self.all_templates)
+            }
+        return self._name_index.get(name.lower())
     
     def add_custom_template(self, template: ScoreTemplate) -> None:
         """
@@ -301,14 +385,30 @@ class TemplateManager:
         Args:
             template: Template to add
         """
+        self._store_custom_template(template)
+        self._save_custom_templates()
+    
+    def add_custom_templates_bulk(self, templates: List[ScoreTemplate]) -> None:
+        """
+        Add several custom templates with a single save.
+        
+        Args:
+            templates: Templates to add
+        """
+        for template in templates:
+            self._store_custom_template(template)
+        self._save_custom_templates()
+    
+    def _store_custom_template(self, template: ScoreTemplate) -> None:
+        """Insert a custom template in memory, replacing any with the same name."""
         template.is_builtin = False
         template.category = TemplateCategory.CUSTOM
         
-        # Remove existing with same name
-        self._custom = [t for t in self._custom if t.name != template.name]
-        
-        self._custom.append(template)
-        self._save_custom_templates()
+        # Re-insert so a replaced template moves to the end
+        name_key = template.name.lower()
+        self._custom.pop(name_key, None)
+        self._custom[name_key] = template
+        self._invalidate_caches()
     
     def remove_custom_template(self, name: str) -> bool:
         """
@@ -320,14 +420,19 @@ class TemplateManager:
         Returns:
             True if removed
         """
-        original_count = len(self._custom)
-        self._custom = [t for t in self._custom if t.name != name]
-        
-        if len(self._custom) < original_count:
+        if self._custom.pop(name.lower(), None) is not None:
+            self._invalidate_caches()
             self._save_custom_templates()
             return True
         return False
     
+    def _invalidate_caches(self) -> None:
+        """Drop derived views after the custom templates change."""
+        self._all_cache = None
+        self._name_index = None
+        self._category_index = None
+        self._revision += 1
+    
     def create_from_score(
         self,
         score,
@@ -345,19 +450,19 @@ class TemplateManager:
         Returns:
             New ScoreTemplate
         """
+        from music21 import clef
+        
         parts = []
         
         for part in score._score.parts:
             clef_name = "treble"
-            for el in part.recurse():
-                if isinstance(el, clef.Clef):
-                    if isinstance(el, clef.BassClef):
-                        clef_name = "bass"
-                    elif isinstance(el, clef.AltoClef):
-                        clef_name = "alto"
-                    elif isinstance(el, clef.TenorClef):
-                        clef_name = "tenor"
-                    break
+            first_clef = next(iter(part.recurse().getElementsByClass(clef.Clef)), None)
+            if isinstance(first_clef, clef.BassClef):
+                clef_name = "bass"
+            elif isinstance(first_clef, clef.AltoClef):
+                clef_name = "alto"
+            elif isinstance(first_clef, clef.TenorClef):
+                clef_name = "tenor"
             
             parts.append(PartTemplate(
                 name=part.partName or f"Part {len(parts) + 1}",
@@ -385,10 +490,16 @@ class TemplateManager:
             return
         
         try:
-            with open(templates_file, 'r') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(templates_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(templates_file, 'r') as f:
+                    data = json.load(f)
             
-            self._custom = [ScoreTemplate.from_dict(t) for t in data]
+            templates = [ScoreTemplate.from_dict(t) for t in data]
+            self._custom = {t.name.lower(): t for t in templates}
+            self._invalidate_caches()
             logger.info(f"Loaded {len(self._custom)} custom templates")
             
         except Exception as e:
@@ -400,15 +511,30 @@ class TemplateManager:
             return
         
         templates_file = self._custom_dir / "templates.json"
+        tmp_file = templates_file.with_suffix('.json.tmp')
         
         try:
-            data = [t.to_dict() for t in self._custom]
-            with open(templates_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                # orjson serializes the dataclasses and enums directly
+                payload = orjson.dumps(
+                    list(self._custom.values()), option=orjson.OPT_INDENT_2
+                )
+            else:
+                data = [t.to_dict() for t in self._custom.values()]
+                payload = json.dumps(data, indent=2).encode('utf-8')
+            
+            # Write to a temp file and swap it in, so a crash mid-write
+            # never leaves a truncated library behind
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, templates_file)
             
             logger.info(f"Saved {len(self._custom)} custom templates")
             
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             logger.error(f"Failed to save custom templates: {e}")
 
 
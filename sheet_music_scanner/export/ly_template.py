@@ -0,0 +1,237 @@
+"""
+LilyPond Template - Fast LilyPond source generation for simple scores.
+
+music21's LilypondConverter walks the whole object tree through a
+generic translation layer. For plain single-voice parts (notes, rests,
+chords, ties, key/time/clef changes) the LilyPond source can be written
+directly from the measures instead. Anything outside that subset is
+reported as unsupported so callers can fall back to music21.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, TYPE_CHECKING
+
+import logging
+
+if TYPE_CHECKING:
+    from music21 import stream
+
+logger = logging.getLogger(__name__)
+
+
+LILYPOND_VERSION = "2.24.0"
+
+_SCORE_TEMPLATE = """\\version "{version}"
+{header}
+\\score {{
+  <<
+{staves}
+  >>
+  \\layout {{ }}
+}}
+"""
+
+_STAFF_TEMPLATE = """    \\new Staff \\with {{ instrumentName = {name} }} {{
+{music}
+    }}"""
+
+# music21 duration type -> LilyPond duration
+_DURATIONS = {
+    "breve": "\\breve",
+    "whole": "1",
+    "half": "2",
+    "quarter": "4",
+    "eighth": "8",
+    "16th": "16",
+    "32nd": "32",
+    "64th": "64",
+}
+
+# Accidental alter -> LilyPond (Dutch) pitch suffix
+_ACCIDENTALS = {
+    0.0: "",
+    1.0: "is",
+    2.0: "isis",
+    -1.0: "es",
+    -2.0: "eses",
+}
+
+# music21 clef class name -> LilyPond clef
+_CLEFS = {
+    "TrebleClef": "treble",
+    "BassClef": "bass",
+    "AltoClef": "alto",
+    "TenorClef": "tenor",
+    "Treble8vbClef": "treble_8",
+    "PercussionClef": "percussion",
+}
+
+# Elements that do not affect the engraved notes
+_IGNORED_CLASSES = ("LayoutBase", "Barline", "Instrument")
+
+
+class _Unsupported(Exception):
+    """Raised when the score uses something the template cannot express."""
+
+
+def render_lilypond(
+    m21_score: stream.Score,
+    title: Optional[str] = None,
+    composer: Optional[str] = None
+) -> Optional[str]:
+    """
+    Render a music21 score to LilyPond source without LilypondConverter.
+    
+    Args:
+        m21_score: Score to render
+        title: Title for the header, or None to omit
+        composer: Composer for the header, or None to omit
+    
+    Returns:
+        LilyPond source, or None if the score uses unsupported features
+    """
+    try:
+        if m21_score.spannerBundle:
+            raise _Unsupported("spanners")
+        
+        staves = [_render_part(part) for part in m21_score.parts]
+        if not staves:
+            raise _Unsupported("no parts")
+    except _Unsupported as e:
+        logger.debug(f"LilyPond template fallback: {e}")
+        return None
+    
+    header_fields = []
+    if title:
+        header_fields.append(f"  title = {_quote(title)}")
+    if composer:
+        header_fields.append(f"  composer = {_quote(composer)}")
+    header = "\\header {\n" + "\n".join(header_fields) + "\n}" if header_fields else ""
+    
+    return _SCORE_TEMPLATE.format(
+        version=LILYPOND_VERSION,
+        header=header,
+        staves="\n".join(staves),
+    )
+
+
+def _render_part(part: stream.Part) -> str:
+    """Render one part as a LilyPond staff."""
+    from music21 import stream
+    
+    if part.spannerBundle:
+        raise _Unsupported("spanners")
+    
+    lines = []
+    for element in part.elements:
+        if isinstance(element, stream.Measure):
+            lines.append(_render_measure(element))
+        elif not element.classSet.intersection(_IGNORED_CLASSES):
+            raise _Unsupported("content outside measures")
+    if not lines:
+        raise _Unsupported("no measures")
+    
+    return _STAFF_TEMPLATE.format(
+        name=_quote(part.partName or ""),
+        music="\n".join(f"      {line} |" for line in lines),
+    )
+
+
+def _render_measure(measure: stream.Measure) -> str:
+    """Render the contents of one measure."""
+    if measure.voices or measure.paddingLeft:
+        raise _Unsupported("voices or pickup measure")
+    
+    tokens: List[str] = []
+    position = 0.0
+    
+    for element in measure:
+        classes = element.classSet
+        
+        if classes.intersection(_IGNORED_CLASSES):
+            continue
+        elif "Clef" in classes:
+            clef_name = _CLEFS.get(type(element).__name__)
+            if clef_name is None:
+                raise _Unsupported(f"clef {element}")
+            tokens.append(f"\\clef {clef_name}")
+        elif "KeySignature" in classes:
+            key_obj = element if "Key" in classes else element.asKey("major")
+            tonic = _pitch_name(key_obj.tonic)
+            if key_obj.mode not in ("major", "minor"):
+                raise _Unsupported(f"mode {key_obj.mode}")
+            tokens.append(f"\\key {tonic} \\{key_obj.mode}")
+        elif "TimeSignature" in classes:
+            tokens.append(f"\\time {element.ratioString}")
+        elif "MetronomeMark" in classes:
+            referent = element.referent
+            if element.number is None or referent.type != "quarter" or referent.dots:
+                raise _Unsupported("tempo")
+            tokens.append(f"\\tempo 4 = {int(element.number)}")
+        elif "GeneralNote" in classes:
+            if abs(element.offset - position) > 1e-6:
+                raise _Unsupported("gap or overlap")
+            tokens.append(_render_note(element))
+            position += element.quarterLength
+        else:
+            raise _Unsupported(type(element).__name__)
+    
+    return " ".join(tokens)
+
+
+def _render_note(element) -> str:
+    """Render a note, chord or rest with its duration and tie."""
+    if element.lyrics or element.expressions or element.articulations:
+        raise _Unsupported("lyrics, expressions or articulations")
+    
+    duration = _duration(element.duration)
+    
+    if element.isRest:
+        return f"r{duration}"
+    
+    if element.isChord:
+        pitches = " ".join(_absolute_pitch(p) for p in element.pitches)
+        token = f"<{pitches}>{duration}"
+    elif element.isNote:
+        token = f"{_absolute_pitch(element.pitch)}{duration}"
+    else:
+        # Unpitched and other pitchless notes
+        raise _Unsupported(type(element).__name__)
+    
+    if element.tie is not None and element.tie.type in ("start", "continue"):
+        token += "~"
+    return token
+
+
+def _duration(duration) -> str:
+    """Convert a music21 duration to LilyPond duration syntax."""
+    if duration.tuplets or duration.isGrace:
+        raise _Unsupported("tuplet or grace note")
+    
+    base = _DURATIONS.get(duration.type)
+    if base is None:
+        raise _Unsupported(f"duration {duration.type}")
+    return base + "." * duration.dots
+
+
+def _pitch_name(pitch) -> str:
+    """LilyPond pitch name without octave marks, e.g. "fis"."""
+    alter = pitch.accidental.alter if pitch.accidental is not None else 0.0
+    suffix = _ACCIDENTALS.get(alter)
+    if suffix is None:
+        raise _Unsupported(f"accidental {pitch.accidental}")
+    
+    return pitch.step.lower() + suffix
+
+
+def _absolute_pitch(pitch) -> str:
+    """LilyPond absolute pitch, where c' is middle C."""
+    marks = pitch.implicitOctave - 3
+    return _pitch_name(pitch) + ("'" * marks if marks > 0 else "," * -marks)
+
+
+def _quote(text: str) -> str:
+    """Quote a string for LilyPond."""
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
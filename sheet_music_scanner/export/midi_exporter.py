@@ -4,14 +4,18 @@ MIDI Exporter - Export scores to MIDI format.
 
 from __future__ import annotations
 
+import copy
+import io
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, Set, TYPE_CHECKING
 from dataclasses import dataclass
 import logging
 
-from sheet_music_scanner.core.score import Score
 from sheet_music_scanner.config import get_config
 
+if TYPE_CHECKING:
+    from sheet_music_scanner.core.score import Score
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +31,10 @@ class MidiExportOptions:
     def __post_init__(self):
         # Validate velocity
         self.velocity = max(0, min(127, self.velocity))
+        
+        # A non-positive tempo is meaningless; treat it as "use score tempo"
+        if self.tempo is not None and self.tempo <= 0:
+            self.tempo = None
 
 
 class MidiExporter:
@@ -46,6 +54,9 @@ class MidiExporter:
         """
         self.options = options or MidiExportOptions()
         self.config = get_config()
+        
+        # Output directories already created by this exporter
+        self._created_dirs: Set[Path] = set()
     
     def export(
         self,
@@ -68,31 +79,57 @@ class MidiExporter:
         if output_path.suffix.lower() not in ['.mid', '.midi']:
             output_path = output_path.with_suffix('.mid')
         
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create output directory if needed (once per directory)
+        if output_path.parent not in self._created_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_path.parent)
         
         # Get the music21 score
         m21_score = score.music21_score
         
+        # Default options: nothing to override, let music21 write directly
+        needs_mutation = self.options.tempo is not None or (
+            self.options.velocity != 80 and score.note_count > 0
+        )
+        if not needs_mutation:
+            m21_score.write('midi', fp=str(output_path))
+            logger.info(f"Exported MIDI to: {output_path}")
+            return output_path
+        
         # Apply tempo override if specified
-        if self.options.tempo:
+        if self.options.tempo is not None:
             from music21 import tempo
             
-            # Remove existing tempo marks
-            for t in m21_score.flatten().getElementsByClass(tempo.MetronomeMark):
-                m21_score.remove(t, recurse=True)
+            # Work on a copy: the caller's score (and its cached exports)
+            # must keep its own tempo
+            m21_score = copy.deepcopy(m21_score)
+            
+            # Remove existing tempo marks directly from their owning streams
+            marks = [
+                (t.activeSite, t)
+                for t in m21_score.recurse().getElementsByClass(tempo.MetronomeMark)
+            ]
+            for site, t in marks:
+                site.remove(t)
             
             # Add new tempo
             mm = tempo.MetronomeMark(number=self.options.tempo)
             m21_score.insert(0, mm)
         
-        # Apply velocity if specified (non-default)
+        from music21.midi.translate import streamToMidiFile
+        
+        midi_file = streamToMidiFile(m21_score)
+        
+        # Apply velocity if specified (non-default) on the translated events,
+        # leaving the score's own note volumes untouched
         if self.options.velocity != 80:
-            for n in m21_score.recurse().notes:
-                n.volume.velocity = self.options.velocity
+            for track in midi_file.tracks:
+                for event in track.events:
+                    if event.isNoteOn():
+                        event.velocity = self.options.velocity
         
         # Write MIDI file
-        m21_score.write('midi', fp=str(output_path))
+        output_path.write_bytes(midi_file.writestr())
         
         logger.info(f"Exported MIDI to: {output_path}")
         return output_path
@@ -125,26 +162,27 @@ class MidiExporter:
         if output_path.suffix.lower() not in ['.mid', '.midi']:
             output_path = output_path.with_suffix('.mid')
         
-        # First export with music21 to temp file
-        temp_path = self.config.temp_dir / "temp_export.mid"
-        score.music21_score.write('midi', fp=str(temp_path))
+        # Default velocity: no message to rewrite, skip the mido round trip
+        if self.options.velocity == 80:
+            score.music21_score.write('midi', fp=str(output_path))
+            logger.info(f"Exported MIDI (mido) to: {output_path}")
+            return output_path
         
-        # Read with mido and apply modifications
-        mid = mido.MidiFile(str(temp_path))
+        # Translate with music21 and hand the bytes to mido in memory
+        from music21.midi.translate import streamToMidiFile
         
-        # Modify velocities if needed
-        if self.options.velocity != 80:
-            for track in mid.tracks:
-                for msg in track:
-                    if msg.type == 'note_on' and msg.velocity > 0:
-                        msg.velocity = self.options.velocity
+        midi_file = streamToMidiFile(score.music21_score)
+        mid = mido.MidiFile(file=io.BytesIO(midi_file.writestr()))
+        
+        # Modify velocities
+        for track in mid.tracks:
+            for msg in track:
+                if msg.type == 'note_on' and msg.velocity > 0:
+                    msg.velocity = self.options.velocity
         
         # Save modified file
         mid.save(str(output_path))
         
-        # Clean up temp file
-        temp_path.unlink(missing_ok=True)
-        
         logger.info(f"Exported MIDI (mido) to: {output_path}")
         return output_path
     
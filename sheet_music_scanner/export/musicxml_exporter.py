@@ -5,7 +5,7 @@ MusicXML Exporter - Export scores to MusicXML format.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, Set
 from dataclasses import dataclass
 import logging
 
@@ -13,6 +13,13 @@ from sheet_music_scanner.core.score import Score
 
 logger = logging.getLogger(__name__)
 
+# Recognised output suffix -> music21 write format
+_SUFFIX_FORMATS = {
+    '.mxl': 'mxl',
+    '.musicxml': 'musicxml',
+    '.xml': 'musicxml',
+}
+
 
 @dataclass
 class MusicXMLExportOptions:
@@ -39,6 +46,9 @@ class MusicXMLExporter:
             options: Export options, or None for defaults
         """
         self.options = options or MusicXMLExportOptions()
+        
+        # Output directories already created by this exporter
+        self._created_dirs: Set[Path] = set()
     
     def export(
         self,
@@ -58,26 +68,26 @@ class MusicXMLExporter:
         output_path = Path(output_path)
         
         # Determine format based on extension or options
-        if self.options.compressed or output_path.suffix.lower() == '.mxl':
+        suffix_format = _SUFFIX_FORMATS.get(output_path.suffix.lower())
+        if self.options.compressed:
             format_type = 'mxl'
-            if output_path.suffix.lower() != '.mxl':
-                output_path = output_path.with_suffix('.mxl')
         else:
-            format_type = 'musicxml'
-            if output_path.suffix.lower() not in ['.musicxml', '.xml']:
-                output_path = output_path.with_suffix('.musicxml')
+            format_type = suffix_format or 'musicxml'
         
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Format names double as the default extensions
+        if suffix_format != format_type:
+            output_path = output_path.with_suffix(f'.{format_type}')
+        
+        # Create output directory if needed (once per directory)
+        if output_path.parent not in self._created_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_path.parent)
         
         # Get the music21 score
         m21_score = score.music21_score
         
         # Write MusicXML file
-        if format_type == 'mxl':
-            m21_score.write('mxl', fp=str(output_path))
-        else:
-            m21_score.write('musicxml', fp=str(output_path))
+        m21_score.write(format_type, fp=str(output_path))
         
         logger.info(f"Exported MusicXML to: {output_path}")
         return output_path
@@ -94,6 +104,21 @@ class MusicXMLExporter:
         """
         return score.to_musicxml_string()
     
+    def export_to_bytes(self, score: Score) -> bytes:
+        """
+        Export score to UTF-8 encoded MusicXML bytes.
+        
+        Use this when the result is written to a socket or file anyway,
+        to skip decoding to str and encoding back.
+        
+        Args:
+            score: Score to export
+            
+        Returns:
+            MusicXML content as bytes
+        """
+        return score.to_musicxml_bytes()
+    
     @staticmethod
     def get_supported_extensions() -> list:
         """Get list of supported file extensions."""
@@ -6,10 +6,23 @@ Uses LilyPond (via music21 or Abjad) or MuseScore for rendering.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import re
 import subprocess
 import shutil
+import threading
+import time
+from contextlib import ExitStack
+from functools import cached_property
 from pathlib import Path
-from typing import Union, Optional
+from typing import Any, Dict, List, Set, Tuple, Union, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -20,6 +33,25 @@ from sheet_music_scanner.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# First MuseScore major version that understands "-j job.json"
+MUSESCORE_JOB_MIN_VERSION = 3
+
+# Verovio scores with at least this many pages convert SVG pages to PDF
+# in worker processes; shorter ones use a single helper thread
+SVG_PROCESS_MIN_PAGES = 4
+
+# Prefix for scratch directories handed to the renderers
+TEMP_DIR_PREFIX = "scoreforge_"
+
+# Size the PDF cache is trimmed back to, dropping the least recently
+# used entries first
+PDF_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# MusicXML details that change between serializations of the same score
+_VOLATILE_MUSICXML = re.compile(
+    rb'(?<=\bid=")[^"]*(?=")|<encoding-date>[^<]*</encoding-date>'
+)
+
 
 class PDFRenderer(Enum):
     """Available PDF rendering backends."""
@@ -28,7 +60,7 @@ class PDFRenderer(Enum):
     VEROVIO = "verovio"  # Verovio (SVG to PDF)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PDFExportOptions:
     """Options for PDF export."""
     
@@ -45,6 +77,173 @@ class PDFExportOptions:
     margin_bottom: float = 0.5
     margin_left: float = 0.5
     margin_right: float = 0.5
+    
+    # Write LilyPond source directly for simple scores instead of going
+    # through music21's translator (falls back automatically)
+    fast_lilypond_template: bool = False
+    
+    # Renderer liveness: abort when no output arrives for stall_timeout
+    # seconds, or after hard_timeout seconds in total (None = no limit)
+    stall_timeout: float = 120.0
+    hard_timeout: Optional[float] = None
+
+
+def _export_one(
+    musicxml: bytes,
+    output_path: Path,
+    options: PDFExportOptions
+) -> Path:
+    """
+    Export one score inside a worker process.
+    
+    The score travels as MusicXML bytes rather than as music21 objects,
+    and each worker gets its own scratch directory.
+    
+    Args:
+        musicxml: Serialized score
+        output_path: Output PDF path
+        options: Export options
+        
+    Returns:
+        Path to the PDF file
+    """
+    with tempfile.TemporaryDirectory(prefix=TEMP_DIR_PREFIX) as td:
+        musicxml_path = Path(td) / "score.musicxml"
+        musicxml_path.write_bytes(musicxml)
+        score = Score.from_musicxml(musicxml_path)
+        return PDFExporter(options).export(score, output_path)
+
+
+def _run_tool(
+    command: List[str],
+    input: Optional[str] = None,
+    stall_timeout: float = 120.0,
+    hard_timeout: Optional[float] = None
+) -> subprocess.CompletedProcess:
+    """
+    Run a renderer executable and capture its output as text.
+    
+    The process is only killed when it stops producing output for
+    ``stall_timeout`` seconds (or exceeds ``hard_timeout``), so large
+    scores that keep reporting progress are not cut off.
+    
+    On POSIX the arguments keep CPython on its posix_spawn fast path: an
+    executable path with a directory, no preexec_fn, no new session and
+    close_fds=False (Python's own descriptors are non-inheritable, so
+    nothing extra leaks into the child). The child is then started with
+    vfork semantics instead of copying the page tables of a process that
+    has music21 loaded.
+    
+    Args:
+        command: Executable and arguments
+        input: Text to feed on stdin, if any
+        stall_timeout: Seconds without output before the process is killed
+        hard_timeout: Total seconds before the process is killed, or None
+        
+    Returns:
+        Completed process with text stdout/stderr
+        
+    Raises:
+        subprocess.TimeoutExpired: If the process stalled or ran too long
+    """
+    executable = command[0]
+    if not os.path.dirname(executable):
+        executable = shutil.which(executable) or executable
+    
+    proc = subprocess.Popen(
+        [executable, *command[1:]],
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        close_fds=os.name != 'posix'
+    )
+    
+    started = last_output = time.monotonic()
+    stdout_lines: List[str] = []
+    stderr_lines: List[str] = []
+    
+    def drain(pipe, lines: List[str]) -> None:
+        nonlocal last_output
+        for line in iter(pipe.readline, ''):
+            lines.append(line)
+            last_output = time.monotonic()
+        pipe.close()
+    
+    def feed() -> None:
+        try:
+            proc.stdin.write(input)
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+    
+    workers = [
+        threading.Thread(target=drain, args=(proc.stdout, stdout_lines), daemon=True),
+        threading.Thread(target=drain, args=(proc.stderr, stderr_lines), daemon=True),
+    ]
+    if input is not None:
+        workers.append(threading.Thread(target=feed, daemon=True))
+    for worker in workers:
+        worker.start()
+    
+    while True:
+        try:
+            proc.wait(timeout=0.5)
+            break
+        except subprocess.TimeoutExpired as e:
+            now = time.monotonic()
+            stalled = now - last_output > stall_timeout
+            overdue = hard_timeout is not None and now - started > hard_timeout
+            if stalled or overdue:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(
+                    command, now - started, ''.join(stdout_lines), ''.join(stderr_lines)
+                ) from e
+    
+    for worker in workers:
+        worker.join()
+    
+    return subprocess.CompletedProcess(
+        command, proc.returncode, ''.join(stdout_lines), ''.join(stderr_lines)
+    )
+
+
+def _process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Start a worker process pool with the spawn start method.
+    
+    Forking would copy the GUI's threads and Qt state into each worker;
+    spawned workers start clean, and in the frozen app they are routed
+    to the pool by the freeze_support() call in main().
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _move_file(source: Path, destination: Path) -> None:
+    """
+    Move a rendered file into place.
+    
+    A rename when both paths share a filesystem; otherwise a copy, which
+    shutil.copyfile performs in-kernel with sendfile where available.
+    """
+    try:
+        os.replace(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _svg_to_pdf_bytes(svg: str) -> bytes:
+    """Convert one rendered SVG page to an in-memory PDF document."""
+    import cairosvg
+    
+    buffer = io.BytesIO()
+    cairosvg.svg2pdf(bytestring=svg.encode('utf-8'), write_to=buffer)
+    return buffer.getvalue()
 
 
 class PDFExporter:
@@ -57,6 +256,19 @@ class PDFExporter:
     - Verovio: Web-friendly, SVG-based
     """
     
+    # Verovio toolkit shared by all exporters in this process. The toolkit
+    # is stateful, so loading and rendering happen under the lock.
+    _verovio_toolkit: Any = None
+    _verovio_options: Optional[Dict[str, Any]] = None
+    _verovio_lock = threading.Lock()
+    
+    # Verovio page sizes (tenths of a millimetre) by paper size
+    _VEROVIO_PAGE_DIMS = {
+        "a4": (2100, 2970),
+        "letter": (2159, 2794),
+        "legal": (2159, 3556),
+    }
+    
     def __init__(self, options: Optional[PDFExportOptions] = None):
         """
         Initialize PDF exporter.
@@ -66,6 +278,20 @@ class PDFExporter:
         """
         self.options = options or PDFExportOptions()
         self.config = get_config()
+        
+        # Options are frozen, so the Verovio settings can be built once
+        page_width, page_height = self._VEROVIO_PAGE_DIMS.get(
+            self.options.paper_size, self._VEROVIO_PAGE_DIMS["letter"]
+        )
+        self._verovio_page_options: Dict[str, Any] = {
+            "pageWidth": page_width,
+            "pageHeight": page_height,
+            "scale": 40,
+            "adjustPageHeight": True,
+        }
+        
+        # Output directories already created by this exporter
+        self._created_dirs: Set[Path] = set()
     
     def export(
         self,
@@ -82,45 +308,487 @@ class PDFExporter:
         Returns:
             Path to created PDF file
         """
+        output_path = self._prepare_output_path(output_path)
+        renderer = self._resolve_renderer()
+        
+        # Serialized once per export: the cache key and the renderer see
+        # the same, current state of the score
+        musicxml = score.to_musicxml_bytes()
+        
+        # Unchanged score, same options: reuse the PDF engraved last time
+        cache_path = self._pdf_cache_dir / f"{self._cache_key(musicxml, renderer)}.pdf"
+        temp_path = self._temp_output_path(output_path)
+        
+        try:
+            if not self._export_from_cache(cache_path, temp_path, output_path):
+                self._export_with(renderer, score, temp_path, musicxml)
+                self._finish_export(temp_path, cache_path, output_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        
+        return output_path
+    
+    @staticmethod
+    def _temp_output_path(output_path: Path) -> Path:
+        """
+        Scratch path beside the output that a render is written to first.
+        
+        The result is moved over the output only once complete, so a
+        failed render keeps the existing file. The rename also detaches a
+        path hard-linked to a cache entry by an earlier hit, so the entry
+        itself is never overwritten.
+        """
+        temp_path = output_path.with_name(f".{output_path.stem}.{os.getpid()}.tmp.pdf")
+        temp_path.unlink(missing_ok=True)
+        return temp_path
+    
+    def _export_from_cache(self, cache_path: Path, temp_path: Path, output_path: Path) -> bool:
+        """Put a cached PDF at output_path; False if there is none."""
+        if not cache_path.exists():
+            return False
+        
+        try:
+            os.link(cache_path, temp_path)
+        except OSError:
+            shutil.copyfile(cache_path, temp_path)
+        os.replace(temp_path, output_path)
+        # Mark the entry as recently used for cache trimming
+        os.utime(cache_path)
+        logger.info(f"Exported cached PDF to: {output_path}")
+        return True
+    
+    def _finish_export(self, temp_path: Path, cache_path: Path, output_path: Path) -> None:
+        """Cache a freshly rendered PDF and move it over the output."""
+        if temp_path.exists():
+            self._store_in_cache(temp_path, cache_path)
+            os.replace(temp_path, output_path)
+    
+    def export_many(
+        self,
+        items: List[Tuple[Score, Union[str, Path]]]
+    ) -> List[Path]:
+        """
+        Export several scores to PDF, sharing one renderer launch where possible.
+        
+        MuseScore converts the whole batch from a single job file and
+        LilyPond engraves all .ly files in one invocation; Verovio has no
+        startup cost to amortize and exports each score in turn.
+        
+        Args:
+            items: (score, output path) pairs
+            
+        Returns:
+            Paths to the created PDF files, in input order
+        """
+        jobs = [(score, self._prepare_output_path(path)) for score, path in items]
+        if not jobs:
+            return []
+        
+        renderer = self._resolve_renderer()
+        
+        if renderer == PDFRenderer.MUSESCORE and self._musescore_supports_jobs():
+            return self._export_many_via_musescore(jobs)
+        if renderer == PDFRenderer.LILYPOND and len(jobs) > 1:
+            return self._export_many_via_lilypond(jobs)
+        
+        return [self._export_with(renderer, score, path) for score, path in jobs]
+    
+    def export_parallel(
+        self,
+        items: List[Tuple[Score, Union[str, Path]]],
+        max_workers: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Export several scores to PDF in parallel worker processes.
+        
+        Args:
+            items: (score, output path) pairs
+            max_workers: Worker process count, or None for one per CPU
+            
+        Returns:
+            Paths to the created PDF files, in input order
+        """
+        if not items:
+            return []
+        
+        # Serialize in the parent so no music21 objects cross the IPC boundary
+        payloads = [
+            (score.to_musicxml_bytes(), Path(path)) for score, path in items
+        ]
+        
+        with _process_pool(max_workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(_export_one, musicxml, path, self.options)
+                for musicxml, path in payloads
+            ]
+            return [future.result() for future in futures]
+    
+    @cached_property
+    def _pdf_cache_dir(self) -> Path:
+        """Directory holding previously exported PDFs by content hash."""
+        cache_dir = self.config.cache_dir / "pdf"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+    
+    def _cache_key(self, musicxml: bytes, renderer: PDFRenderer) -> str:
+        """Hash a score's MusicXML together with the export settings."""
+        musicxml = _VOLATILE_MUSICXML.sub(b"", musicxml)
+        settings = repr((renderer, dataclasses.asdict(self.options)))
+        digest = hashlib.blake2b(musicxml, digest_size=20)
+        digest.update(settings.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _store_in_cache(self, pdf_path: Path, cache_path: Path) -> None:
+        """Copy an exported PDF into the cache, atomically."""
+        temp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            shutil.copyfile(pdf_path, temp_path)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            logger.warning(f"Could not cache PDF: {pdf_path}")
+            temp_path.unlink(missing_ok=True)
+            return
+        self._trim_cache()
+    
+    def _trim_cache(self, max_bytes: int = PDF_CACHE_MAX_BYTES) -> None:
+        """Delete the least recently used cached PDFs beyond max_bytes."""
+        entries = []
+        with os.scandir(self._pdf_cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.pdf'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+    
+    async def export_async_many(
+        self,
+        items: List[Tuple[Score, Union[str, Path]]]
+    ) -> List[Path]:
+        """
+        Export several scores concurrently with asyncio subprocesses.
+        
+        LilyPond and MuseScore runs overlap, bounded by the CPU count;
+        Verovio exports run on worker threads. Synchronous callers can use
+        ``asyncio.run(exporter.export_async_many(items))``.
+        
+        Args:
+            items: (score, output path) pairs
+            
+        Returns:
+            Paths to the created PDF files, in input order
+        """
+        if not items:
+            return []
+        
+        renderer = self._resolve_renderer()
+        semaphore = asyncio.Semaphore(min(os.cpu_count() or 1, len(items)))
+        
+        async def export_one(score: Score, path: Union[str, Path]) -> Path:
+            async with semaphore:
+                return await self._export_one_async(
+                    renderer, score, self._prepare_output_path(path)
+                )
+        
+        return list(await asyncio.gather(
+            *(export_one(score, path) for score, path in items)
+        ))
+    
+    async def _export_one_async(
+        self,
+        renderer: PDFRenderer,
+        score: Score,
+        output_path: Path
+    ) -> Path:
+        """
+        Export a single score without blocking the event loop.
+        
+        Uses the same PDF cache and temporary-file write as export(), so
+        a failed or cancelled run never leaves a partial PDF behind.
+        """
+        musicxml = await asyncio.to_thread(score.to_musicxml_bytes)
+        cache_path = self._pdf_cache_dir / f"{self._cache_key(musicxml, renderer)}.pdf"
+        temp_path = self._temp_output_path(output_path)
+        
+        try:
+            if not self._export_from_cache(cache_path, temp_path, output_path):
+                await self._render_async(renderer, score, temp_path, musicxml)
+                self._finish_export(temp_path, cache_path, output_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        
+        return output_path
+    
+    async def _render_async(
+        self,
+        renderer: PDFRenderer,
+        score: Score,
+        output_path: Path,
+        musicxml: bytes
+    ) -> Path:
+        """Render a score to output_path with an asyncio subprocess or thread."""
+        if renderer == PDFRenderer.VEROVIO:
+            return await asyncio.to_thread(
+                self._export_via_verovio, score, output_path, musicxml
+            )
+        
+        if renderer == PDFRenderer.LILYPOND:
+            # music21's translator is slow; keep it off the event loop
+            ly_text = await asyncio.to_thread(self._lilypond_source, score)
+            returncode, stderr = await self._run_tool_async(
+                self._lilypond_command(
+                    output_path.parent / output_path.stem, ["-"]
+                ),
+                input=ly_text.encode('utf-8'),
+                **self._timeouts()
+            )
+            if returncode != 0:
+                logger.error(f"LilyPond error: {stderr}")
+                # Try music21's direct export as fallback
+                await asyncio.to_thread(
+                    score.music21_score.write, 'lily.pdf', fp=output_path
+                )
+            logger.info(f"Exported PDF via LilyPond to: {output_path}")
+            return output_path
+        
+        with tempfile.TemporaryDirectory(prefix=TEMP_DIR_PREFIX) as td:
+            musicxml_path = Path(td) / "score.musicxml"
+            musicxml_path.write_bytes(musicxml)
+            returncode, stderr = await self._run_tool_async([
+                self.config.musescore_path,
+                "-o", os.fspath(output_path),
+                os.fspath(musicxml_path)
+            ], **self._timeouts())
+        
+        if returncode != 0:
+            logger.error(f"MuseScore error: {stderr}")
+            raise RuntimeError(f"MuseScore failed: {stderr}")
+        
+        logger.info(f"Exported PDF via MuseScore to: {output_path}")
+        return output_path
+    
+    def _timeouts(self, scale: int = 1) -> Dict[str, Optional[float]]:
+        """Renderer timeouts from the options, scaled for batch runs."""
+        hard_timeout = self.options.hard_timeout
+        return {
+            "stall_timeout": self.options.stall_timeout * scale,
+            "hard_timeout": hard_timeout * scale if hard_timeout is not None else None,
+        }
+    
+    @staticmethod
+    async def _run_tool_async(
+        command: List[str],
+        input: Optional[bytes] = None,
+        stall_timeout: float = 120.0,
+        hard_timeout: Optional[float] = None
+    ) -> Tuple[int, str]:
+        """
+        Run a renderer subprocess from the event loop.
+        
+        Uses the same stall/hard timeout rules as the blocking path.
+        
+        Returns:
+            (return code, decoded stderr)
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE if input is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        loop = asyncio.get_running_loop()
+        started = last_output = loop.time()
+        stderr_lines: List[bytes] = []
+        
+        async def drain(stream, lines: Optional[List[bytes]]) -> None:
+            nonlocal last_output
+            async for line in stream:
+                if lines is not None:
+                    lines.append(line)
+                last_output = loop.time()
+        
+        async def feed() -> None:
+            try:
+                proc.stdin.write(input)
+                await proc.stdin.drain()
+                proc.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        
+        tasks = [
+            asyncio.ensure_future(drain(proc.stdout, None)),
+            asyncio.ensure_future(drain(proc.stderr, stderr_lines)),
+        ]
+        if input is not None:
+            tasks.append(asyncio.ensure_future(feed()))
+        
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(asyncio.shield(proc.wait()), 0.5)
+                    break
+                except asyncio.TimeoutError as e:
+                    now = loop.time()
+                    stalled = now - last_output > stall_timeout
+                    overdue = hard_timeout is not None and now - started > hard_timeout
+                    if stalled or overdue:
+                        proc.kill()
+                        await proc.wait()
+                        raise subprocess.TimeoutExpired(command, now - started) from e
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        return proc.returncode, b''.join(stderr_lines).decode('utf-8', errors='replace')
+    
+    def _prepare_output_path(self, output_path: Union[str, Path]) -> Path:
+        """Normalize the output path to .pdf and create its directory."""
         output_path = Path(output_path)
         
         # Ensure .pdf extension
         if output_path.suffix.lower() != '.pdf':
             output_path = output_path.with_suffix('.pdf')
         
-        # Create output directory if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
+        # Create output directory if needed (once per directory)
+        if output_path.parent not in self._created_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_path.parent)
+        return output_path
+    
+    def _resolve_renderer(self) -> PDFRenderer:
+        """Pick the renderer to use, falling back to what is installed."""
         # Try renderers in order of preference
         if self.options.renderer == PDFRenderer.LILYPOND:
-            if self._has_lilypond():
-                return self._export_via_lilypond(score, output_path)
-            elif self._has_musescore():
+            if self._has_lilypond:
+                return PDFRenderer.LILYPOND
+            elif self._has_musescore:
                 logger.warning("LilyPond not found, falling back to MuseScore")
-                return self._export_via_musescore(score, output_path)
+                return PDFRenderer.MUSESCORE
             else:
-                return self._export_via_verovio(score, output_path)
+                return PDFRenderer.VEROVIO
         
         elif self.options.renderer == PDFRenderer.MUSESCORE:
-            if self._has_musescore():
-                return self._export_via_musescore(score, output_path)
-            elif self._has_lilypond():
+            if self._has_musescore:
+                return PDFRenderer.MUSESCORE
+            elif self._has_lilypond:
                 logger.warning("MuseScore not found, falling back to LilyPond")
-                return self._export_via_lilypond(score, output_path)
+                return PDFRenderer.LILYPOND
             else:
-                return self._export_via_verovio(score, output_path)
+                return PDFRenderer.VEROVIO
         
         else:  # VEROVIO
-            return self._export_via_verovio(score, output_path)
+            return PDFRenderer.VEROVIO
     
+    def _export_with(
+        self,
+        renderer: PDFRenderer,
+        score: Score,
+        output_path: Path,
+        musicxml: Optional[bytes] = None
+    ) -> Path:
+        """
+        Export a single score with the given renderer.
+        
+        ``musicxml`` is the score already serialized by the caller, if
+        any; the MusicXML-based renderers use it instead of serializing
+        again.
+        """
+        if renderer == PDFRenderer.LILYPOND:
+            return self._export_via_lilypond(score, output_path)
+        elif renderer == PDFRenderer.MUSESCORE:
+            return self._export_via_musescore(score, output_path, musicxml)
+        else:
+            return self._export_via_verovio(score, output_path, musicxml)
+    
+    @cached_property
     def _has_lilypond(self) -> bool:
-        """Check if LilyPond is available."""
+        """Check if LilyPond is available (looked up once per exporter)."""
         return self.config.has_lilypond()
     
+    @cached_property
     def _has_musescore(self) -> bool:
-        """Check if MuseScore is available."""
+        """Check if MuseScore is available (looked up once per exporter)."""
         return self.config.has_musescore()
     
+    @cached_property
+    def _musescore_major_version(self) -> Optional[int]:
+        """Major version reported by ``musescore --version``, if any."""
+        try:
+            result = _run_tool(
+                [self.config.musescore_path, "--version"], hard_timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        
+        match = re.search(r"(\d+)\.\d+", result.stdout + result.stderr)
+        return int(match.group(1)) if match else None
+    
+    def _musescore_supports_jobs(self) -> bool:
+        """Check whether MuseScore can run a batch conversion job file."""
+        version = self._musescore_major_version
+        return version is not None and version >= MUSESCORE_JOB_MIN_VERSION
+    
+    def _lilypond_command(
+        self,
+        output: Path,
+        sources: List[Union[str, Path]]
+    ) -> List[str]:
+        """Build the LilyPond command line for .ly files, or "-" for stdin."""
+        return [
+            self.config.lilypond_path,
+            # PROGRESS drops the informational chatter but keeps the
+            # per-stage lines the stall watchdog relies on
+            "--loglevel=PROGRESS",
+            # No textedit:// links back to the (temporary) source
+            "-dno-point-and-click",
+            f'-dpaper-size="{self.options.paper_size}"',
+            f"--output={output}",
+            *(os.fspath(source) for source in sources)
+        ]
+    
+    def _lilypond_source(self, score: Score) -> str:
+        """
+        Generate LilyPond source for a score.
+        
+        Uses the direct template when enabled and the score is simple
+        enough, otherwise music21's LilypondConverter.
+        """
+        if self.options.fast_lilypond_template:
+            from sheet_music_scanner.export.ly_template import render_lilypond
+            
+            ly_text = render_lilypond(
+                score.music21_score,
+                title=score.title if self.options.include_title else None,
+                composer=score.composer if self.options.include_composer else None
+            )
+            if ly_text is not None:
+                return ly_text
+        
+        # Configure music21 to use our LilyPond path
+        from music21 import environment
+        from music21.lily.translate import LilypondConverter
+        
+        env = environment.Environment()
+        if self.config.lilypond_path:
+            env['lilypondPath'] = self.config.lilypond_path
+        
+        converter = LilypondConverter()
+        converter.loadFromMusic21Object(score.music21_score)
+        return str(converter.topLevelObject)
+    
     def _export_via_lilypond(
         self,
         score: Score,
@@ -137,44 +805,22 @@ class PDFExporter:
             Path to PDF file
         """
         try:
-            # music21 can export directly to LilyPond PDF
-            # Configure music21 to use our LilyPond path
-            from music21 import environment
-            
-            env = environment.Environment()
-            if self.config.lilypond_path:
-                env['lilypondPath'] = self.config.lilypond_path
-            
-            # Export via LilyPond
             m21_score = score.music21_score
+            ly_text = self._lilypond_source(score)
             
-            # Write to temporary .ly file first for more control
-            temp_dir = Path(tempfile.mkdtemp())
-            ly_path = temp_dir / "score.ly"
-            
-            # Export as LilyPond format
-            m21_score.write('lily', fp=str(ly_path))
-            
-            # Run LilyPond to create PDF
-            result = subprocess.run(
-                [
-                    self.config.lilypond_path,
-                    f"--output={output_path.parent / output_path.stem}",
-                    f"--{self.options.paper_size}",
-                    str(ly_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120
+            # Run LilyPond to create PDF, feeding the source on stdin
+            result = _run_tool(
+                self._lilypond_command(
+                    output_path.parent / output_path.stem, ["-"]
+                ),
+                input=ly_text,
+                **self._timeouts()
             )
             
             if result.returncode != 0:
                 logger.error(f"LilyPond error: {result.stderr}")
                 # Try music21's direct export as fallback
-                m21_score.write('lily.pdf', fp=str(output_path))
-            
-            # Clean up temp files
-            shutil.rmtree(temp_dir, ignore_errors=True)
+                m21_score.write('lily.pdf', fp=output_path)
             
             logger.info(f"Exported PDF via LilyPond to: {output_path}")
             return output_path
@@ -186,7 +832,8 @@ class PDFExporter:
     def _export_via_musescore(
         self,
         score: Score,
-        output_path: Path
+        output_path: Path,
+        musicxml: Optional[bytes] = None
     ) -> Path:
         """
         Export using MuseScore CLI.
@@ -194,36 +841,30 @@ class PDFExporter:
         Args:
             score: Score to export
             output_path: Output path
+            musicxml: The score already serialized, or None to serialize it
             
         Returns:
             Path to PDF file
         """
         try:
             # First export to MusicXML
-            temp_dir = Path(tempfile.mkdtemp())
-            musicxml_path = temp_dir / "score.musicxml"
-            
-            score.to_musicxml(musicxml_path)
-            
-            # Run MuseScore to convert to PDF
-            result = subprocess.run(
-                [
+            with tempfile.TemporaryDirectory(prefix=TEMP_DIR_PREFIX) as td:
+                musicxml_path = Path(td) / "score.musicxml"
+                musicxml_path.write_bytes(
+                    musicxml if musicxml is not None else score.to_musicxml_bytes()
+                )
+                
+                # Run MuseScore to convert to PDF
+                result = _run_tool([
                     self.config.musescore_path,
-                    "-o", str(output_path),
-                    str(musicxml_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+                    "-o", os.fspath(output_path),
+                    os.fspath(musicxml_path)
+                ], **self._timeouts())
             
             if result.returncode != 0:
                 logger.error(f"MuseScore error: {result.stderr}")
                 raise RuntimeError(f"MuseScore failed: {result.stderr}")
             
-            # Clean up temp files
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            
             logger.info(f"Exported PDF via MuseScore to: {output_path}")
             return output_path
             
@@ -231,10 +872,95 @@ class PDFExporter:
             logger.exception("MuseScore export failed")
             raise
     
+    def _export_many_via_lilypond(
+        self,
+        jobs: List[Tuple[Score, Path]]
+    ) -> List[Path]:
+        """
+        Engrave a batch of scores with a single LilyPond invocation.
+        
+        Scores whose PDF LilyPond did not produce are retried one at a
+        time through the regular single-score path.
+        
+        Args:
+            jobs: (score, normalized output path) pairs
+            
+        Returns:
+            Paths to the PDF files
+        """
+        with tempfile.TemporaryDirectory(prefix=TEMP_DIR_PREFIX) as td:
+            temp_dir = Path(td)
+            ly_paths = []
+            for i, (score, _) in enumerate(jobs):
+                ly_path = temp_dir / f"{i}.ly"
+                ly_path.write_text(self._lilypond_source(score), encoding='utf-8')
+                ly_paths.append(ly_path)
+            
+            # With a directory as --output each PDF is named after its .ly file
+            result = _run_tool(
+                self._lilypond_command(temp_dir, ly_paths),
+                **self._timeouts()
+            )
+            if result.returncode != 0:
+                logger.error(f"LilyPond error: {result.stderr}")
+            
+            exported = []
+            for ly_path, (score, output_path) in zip(ly_paths, jobs, strict=True):
+                pdf_path = ly_path.with_suffix('.pdf')
+                if pdf_path.exists():
+                    _move_file(pdf_path, output_path)
+                    logger.info(f"Exported PDF via LilyPond to: {output_path}")
+                else:
+                    self._export_via_lilypond(score, output_path)
+                exported.append(output_path)
+            return exported
+    
+    def _export_many_via_musescore(
+        self,
+        jobs: List[Tuple[Score, Path]]
+    ) -> List[Path]:
+        """
+        Convert a batch of scores with a single MuseScore job file.
+        
+        Args:
+            jobs: (score, normalized output path) pairs
+            
+        Returns:
+            Paths to the PDF files
+        """
+        with tempfile.TemporaryDirectory(prefix=TEMP_DIR_PREFIX) as td:
+            temp_dir = Path(td)
+            job_entries = []
+            for i, (score, output_path) in enumerate(jobs):
+                musicxml_path = temp_dir / f"{i}.musicxml"
+                musicxml_path.write_bytes(score.to_musicxml_bytes())
+                job_entries.append(
+                    {"in": os.fspath(musicxml_path), "out": os.fspath(output_path)}
+                )
+            
+            job_path = temp_dir / "job.json"
+            with open(job_path, 'w', encoding='utf-8') as f:
+                json.dump(job_entries, f)
+            
+            # MuseScore is silent while converting, so allow the whole batch
+            result = _run_tool(
+                [self.config.musescore_path, "-j", os.fspath(job_path)],
+                **self._timeouts(len(jobs))
+            )
+        
+        if result.returncode != 0:
+            logger.error(f"MuseScore error: {result.stderr}")
+            raise RuntimeError(f"MuseScore failed: {result.stderr}")
+        
+        for _, output_path in jobs:
+            logger.info(f"Exported PDF via MuseScore to: {output_path}")
+        return [output_path for _, output_path in jobs]
+    
     def _export_via_verovio(
         self,
         score: Score,
-        output_path: Path
+        output_path: Path,
+        musicxml: Optional[bytes] = None
     ) -> Path:
         """
         Export using Verovio (SVG to PDF).
@@ -242,6 +968,7 @@ class PDFExporter:
         Args:
             score: Score to export
             output_path: Output path
+            musicxml: The score already serialized, or None to serialize it
             
         Returns:
             Path to PDF file
@@ -254,39 +981,45 @@ class PDFExporter:
             )
         
         try:
-            # Export to MusicXML first
-            temp_dir = Path(tempfile.mkdtemp())
-            musicxml_path = temp_dir / "score.musicxml"
-            score.to_musicxml(musicxml_path)
-            
-            # Initialize Verovio
-            toolkit = verovio.toolkit()
-            toolkit.setOptions({
-                "pageWidth": 2100 if self.options.paper_size == "a4" else 2159,
-                "pageHeight": 2970 if self.options.paper_size == "a4" else 2794,
-                "scale": 40,
-                "adjustPageHeight": True,
-            })
-            
-            # Load MusicXML
-            toolkit.loadFile(str(musicxml_path))
-            
-            # Render all pages as SVG
-            page_count = toolkit.getPageCount()
-            svg_paths = []
-            
-            for i in range(1, page_count + 1):
-                svg = toolkit.renderToSVG(i)
-                svg_path = temp_dir / f"page_{i}.svg"
-                svg_path.write_text(svg)
-                svg_paths.append(svg_path)
-            
-            # Convert SVGs to PDF
-            # This requires additional tools like cairosvg or rsvg-convert
-            self._svgs_to_pdf(svg_paths, output_path)
+            import cairosvg  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "PDF conversion requires cairosvg and pypdf. "
+                "Install with: pip install cairosvg pypdf"
+            )
+        
+        if musicxml is None:
+            musicxml = score.to_musicxml_bytes()
+        
+        try:
+            # Pages are converted to PDF by a worker pool while the
+            # (single, non thread-safe) toolkit renders the next page
+            with ExitStack() as stack:
+                with PDFExporter._verovio_lock:
+                    toolkit = PDFExporter._verovio_toolkit
+                    if toolkit is None:
+                        toolkit = PDFExporter._verovio_toolkit = verovio.toolkit()
+                    
+                    # Only re-parse options when they differ from the last export
+                    verovio_options = self._verovio_page_options
+                    if PDFExporter._verovio_options != verovio_options:
+                        toolkit.setOptions(verovio_options)
+                        PDFExporter._verovio_options = verovio_options
+                    
+                    # Load the score's MusicXML straight from memory
+                    toolkit.loadData(musicxml.decode('utf-8'))
+                    
+                    # Render all pages as SVG, kept in memory
+                    page_count = toolkit.getPageCount()
+                    pool = stack.enter_context(self._page_converter(page_count))
+                    page_futures = [
+                        pool.submit(_svg_to_pdf_bytes, toolkit.renderToSVG(i))
+                        for i in range(1, page_count + 1)
+                    ]
+                
+                pdf_pages = [future.result() for future in page_futures]
             
-            # Clean up
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            self._write_pdf_pages(pdf_pages, output_path)
             
             logger.info(f"Exported PDF via Verovio to: {output_path}")
             return output_path
@@ -295,51 +1028,75 @@ class PDFExporter:
             logger.exception("Verovio export failed")
             raise
     
-    def _svgs_to_pdf(self, svg_paths: list, output_path: Path) -> None:
+    @staticmethod
+    def _page_converter(page_count: int) -> Executor:
+        """
+        Pick the executor that converts rendered SVG pages to PDF.
+        
+        cairo keeps global state that does not take well to threads, so
+        longer scores fan out over processes; short ones are not worth
+        the process start-up and use one helper thread.
+        """
+        if page_count >= SVG_PROCESS_MIN_PAGES:
+            return _process_pool(min(page_count, os.cpu_count() or 1))
+        return ThreadPoolExecutor(max_workers=1)
+    
+    def _write_pdf_pages(self, pdf_pages: List[bytes], output_path: Path) -> None:
         """
-        Convert SVG files to PDF.
+        Write converted PDF pages to a single file.
         
         Args:
-            svg_paths: List of SVG file paths
+            pdf_pages: PDF documents, one per page
+            output_path: Output PDF path
+        """
+        if len(pdf_pages) == 1:
+            output_path.write_bytes(pdf_pages[0])
+        else:
+            self._merge_pdfs(pdf_pages, output_path)
+    
+    def _merge_pdfs(self, pdf_pages: List[bytes], output_path: Path) -> None:
+        """
+        Merge in-memory PDF documents into one file.
+        
+        Args:
+            pdf_pages: PDF documents to concatenate, in order
             output_path: Output PDF path
         """
         try:
-            import cairosvg
-            from PyPDF2 import PdfMerger
+            import pikepdf
         except ImportError:
-            # Fallback: just use first page and try simple conversion
-            if svg_paths:
-                try:
-                    import cairosvg
-                    cairosvg.svg2pdf(
-                        url=str(svg_paths[0]),
-                        write_to=str(output_path)
-                    )
-                    return
-                except ImportError:
-                    pass
-            
-            raise RuntimeError(
-                "PDF conversion requires cairosvg and PyPDF2. "
-                "Install with: pip install cairosvg PyPDF2"
-            )
+            pikepdf = None
         
-        # Convert each SVG to PDF
-        pdf_paths = []
-        for svg_path in svg_paths:
-            pdf_path = svg_path.with_suffix('.pdf')
-            cairosvg.svg2pdf(url=str(svg_path), write_to=str(pdf_path))
-            pdf_paths.append(pdf_path)
+        if pikepdf is not None:
+            # qpdf copies the page objects natively
+            merged = pikepdf.Pdf.new()
+            sources = [pikepdf.Pdf.open(io.BytesIO(page)) for page in pdf_pages]
+            try:
+                for source in sources:
+                    merged.pages.extend(source.pages)
+                merged.save(str(output_path))
+            finally:
+                for source in sources:
+                    source.close()
+                merged.close()
+            return
         
-        # Merge PDFs
-        if len(pdf_paths) == 1:
-            shutil.copy(pdf_paths[0], output_path)
-        else:
-            merger = PdfMerger()
-            for pdf_path in pdf_paths:
-                merger.append(str(pdf_path))
-            merger.write(str(output_path))
-            merger.close()
+        try:
+            from pypdf import PdfWriter
+        except ImportError:
+            try:
+                from PyPDF2 import PdfMerger as PdfWriter
+            except ImportError:
+                # Fallback: just use first page
+                logger.warning("pypdf not installed, writing first page only")
+                output_path.write_bytes(pdf_pages[0])
+                return
+        
+        writer = PdfWriter()
+        for page in pdf_pages:
+            writer.append(io.BytesIO(page))
+        writer.write(str(output_path))
+        writer.close()
     
     def get_available_renderers(self) -> list:
         """
@@ -350,10 +1107,10 @@ class PDFExporter:
         """
         available = []
         
-        if self._has_lilypond():
+        if self._has_lilypond:
             available.append(PDFRenderer.LILYPOND)
         
-        if self._has_musescore():
+        if self._has_musescore:
             available.append(PDFRenderer.MUSESCORE)
         
         try:
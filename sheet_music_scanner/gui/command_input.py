@@ -7,15 +7,21 @@ highlighting, auto-completion, and real-time preview.
 
 from __future__ import annotations
 
-from typing import Optional
+from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+import io
 import logging
+import re
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
     QLabel, QFrame, QSplitter, QToolButton, QMenu, QMessageBox,
-    QPlainTextEdit, QCompleter, QSizePolicy,
+    QPlainTextEdit, QCompleter, QSizePolicy, QDialog, QDialogButtonBox,
+    QTextBrowser,
 )
-from PySide6.QtCore import Qt, Signal, QStringListModel
+from PySide6.QtCore import Qt, Signal, QStringListModel, QTimer
 from PySide6.QtGui import (
     QFont, QColor, QTextCharFormat, QSyntaxHighlighter,
     QTextDocument, QKeySequence, QShortcut, QTextCursor,
@@ -30,12 +36,138 @@ from sheet_music_scanner.gui.theme import get_theme_manager
 logger = logging.getLogger(__name__)
 
 
+class _TokenKind(Enum):
+    """Highlightable kinds of plain (unquoted, non-bracket) tokens."""
+    REST = "rest"
+    PITCH = "pitch"
+    DURATION = "duration"
+    BARLINE = "barline"
+
+
+_PITCH_LETTERS = frozenset("ABCDEFGabcdefg")
+_ACCIDENTAL_CHARS = frozenset("#b")
+_DURATION_LETTERS = frozenset("whqestWHQEST")
+_DIGITS = frozenset("0123456789")
+_CMD_PREFIXES = ("key:", "time:", "tempo:", "clef:")
+
+# Whole-word keywords (matched case-insensitively)
+_KEYWORD_KINDS = {
+    "r": _TokenKind.REST,
+    "rest": _TokenKind.REST,
+    "measure": _TokenKind.BARLINE,
+}
+_KEYWORD_INITIALS = frozenset(c for word in _KEYWORD_KINDS for c in word[0] + word[0].upper())
+
+# Static auto-completion entries, identical for every panel
+_COMPLETIONS = [
+    # Pitches
+    "C4", "D4", "E4", "F4", "G4", "A4", "B4",
+    "C5", "D5", "E5", "F5", "G5", "A5", "B5",
+    "C3", "D3", "E3", "F3", "G3", "A3", "B3",
+    # Accidentals
+    "C#4", "D#4", "F#4", "G#4", "A#4",
+    "Db4", "Eb4", "Gb4", "Ab4", "Bb4",
+    # Durations
+    "w", "h", "q", "e", "s",
+    "w.", "h.", "q.", "e.", "s.",
+    # Commands
+    "key:", "time:", "tempo:", "clef:",
+    "key: C major", "key: G major", "key: D major",
+    "key: A minor", "key: E minor",
+    "time: 4/4", "time: 3/4", "time: 6/8", "time: 2/4",
+    "tempo: 60", "tempo: 80", "tempo: 100", "tempo: 120",
+    "clef: treble", "clef: bass", "clef: alto",
+    # Rests
+    "r", "r q", "r h", "r w", "r e",
+    # Barlines
+    "|", "||", "|||", "measure",
+]
+
+# Built on first use and shared by every panel's completer
+_COMPLETION_MODEL: Optional[QStringListModel] = None
+
+
+def _get_completion_model() -> QStringListModel:
+    """Get the shared completion model, creating it if needed."""
+    global _COMPLETION_MODEL
+    if _COMPLETION_MODEL is None:
+        _COMPLETION_MODEL = QStringListModel(_COMPLETIONS)
+    return _COMPLETION_MODEL
+
+
+# Editor font, resolved once since font matching is not free
+_MONO_FONT: Optional[QFont] = None
+
+
+def _get_mono_font() -> QFont:
+    """Get the platform-appropriate monospace editor font."""
+    global _MONO_FONT
+    if _MONO_FONT is None:
+        font = QFont("Menlo")  # macOS default monospace
+        if not font.exactMatch():
+            font = QFont("Consolas")  # Windows fallback
+        if not font.exactMatch():
+            font.setStyleHint(QFont.StyleHint.Monospace)
+        font.setPointSize(12)
+        _MONO_FONT = font
+    return _MONO_FONT
+
+
+def _classify_token(token: str) -> Optional[_TokenKind]:
+    """
+    Classify a token with a keyword lookup and plain character checks.
+    
+    Equivalent to the old regexes: pitch ``[A-Ga-g][#b]{0,2}\\d``,
+    duration ``[whqest]\\.?`` (any case), rest ``r``/``rest`` and the
+    ``measure`` barline word.
+    """
+    length = len(token)
+    first = token[0]
+    
+    # Only lowercase tokens that could be a keyword at all
+    if first in _KEYWORD_INITIALS:
+        keyword = _KEYWORD_KINDS.get(token.lower())
+        if keyword is not None:
+            return keyword
+    
+    if first in _DURATION_LETTERS and (length == 1 or (length == 2 and token[1] == '.')):
+        # "e" is also a pitch letter, but a bare letter has no octave
+        return _TokenKind.DURATION
+    
+    if (
+        2 <= length <= 4
+        and first in _PITCH_LETTERS
+        and token[-1] in _DIGITS
+        and all(c in _ACCIDENTAL_CHARS for c in token[1:-1])
+    ):
+        return _TokenKind.PITCH
+    return None
+
+
+# (start, length, format) applied to one block
+FormatRange = Tuple[int, int, QTextCharFormat]
+
+
 class CommandSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for music commands."""
     
+    # Lyrics (an unterminated one runs to the end), chord brackets,
+    # barlines and plain words, in a single pass over a line
+    _TOKEN_RE = re.compile(
+        r'(?P<lyric>"[^"]*"?)'
+        r'|(?P<bracket>[\[\]])'
+        r'|(?P<barline>\|+)'
+        r'|(?P<word>[^\s"\[\]|]+)'
+    )
+    
     def __init__(self, document: QTextDocument):
         super().__init__(document)
         self._setup_formats()
+        
+        # Block number -> (text, format ranges) from the last highlight
+        self._block_cache: Dict[int, Tuple[str, List[FormatRange]]] = {}
+        self._block_count = document.blockCount()
+        document.contentsChange.connect(self._on_contents_change)
     
     def _setup_formats(self):
         """Set up text formats for different syntax elements."""
@@ -83,87 +215,153 @@ class CommandSyntaxHighlighter(QSyntaxHighlighter):
         self.bracket_format = QTextCharFormat()
         self.bracket_format.setForeground(QColor("#E91E63"))  # Pink
         self.bracket_format.setFontWeight(QFont.Weight.Bold)
+        
+        # Formats for classified plain tokens
+        self._token_formats = {
+            _TokenKind.REST: self.rest_format,
+            _TokenKind.PITCH: self.pitch_format,
+            _TokenKind.DURATION: self.duration_format,
+            _TokenKind.BARLINE: self.barline_format,
+        }
+        
+        # Formats for the non-word groups of _TOKEN_RE
+        self._group_formats = {
+            'lyric': self.lyric_format,
+            'bracket': self.bracket_format,
+            'barline': self.barline_format,
+        }
+    
+    def _on_contents_change(self, position: int, removed: int, added: int):
+        """Drop cache entries for blocks that no longer exist."""
+        # Edited blocks are re-highlighted (and re-cached) by Qt itself;
+        # only entries past the end of a shrunk document go stale.
+        block_count = self.document().blockCount()
+        if block_count < self._block_count:
+            for number in [n for n in self._block_cache if n >= block_count]:
+                del self._block_cache[number]
+        self._block_count = block_count
     
     def highlightBlock(self, text: str):
         """Highlight a block of text."""
-        import re
+        number = self.currentBlock().blockNumber()
+        cached = self._block_cache.get(number)
+        if cached is not None and cached[0] == text:
+            ranges = cached[1]
+        else:
+            ranges = self._format_ranges(text)
+            self._block_cache[number] = (text, ranges)
+        
+        for start, length, fmt in ranges:
+            self.setFormat(start, length, fmt)
+    
+    def _format_ranges(self, text: str) -> List[FormatRange]:
+        """Tokenize one line into the format ranges to apply."""
+        ranges: List[FormatRange] = []
         
         # Skip empty lines
         if not text.strip():
-            return
+            return ranges
         
         # Comments
         if text.strip().startswith("#"):
-            self.setFormat(0, len(text), self.comment_format)
-            return
-        
-        # Commands (key:, time:, tempo:, clef:)
-        cmd_match = re.match(r"^(key|time|tempo|clef):", text, re.IGNORECASE)
-        if cmd_match:
-            self.setFormat(0, cmd_match.end(), self.command_format)
-            return
-        
-        # Process tokens
-        pos = 0
-        while pos < len(text):
-            # Skip whitespace
-            if text[pos].isspace():
-                pos += 1
-                continue
-            
-            # Find next token boundary
-            token_start = pos
-            
-            # Handle quoted strings
-            if text[pos] == '"':
-                end = text.find('"', pos + 1)
-                if end != -1:
-                    self.setFormat(pos, end - pos + 1, self.lyric_format)
-                    pos = end + 1
+            ranges.append((0, len(text), self.comment_format))
+            return ranges
+        
+        # Commands (key:, time:, tempo:, clef:), indented like the parser allows
+        stripped = text.lstrip()
+        if stripped[:6].lower().startswith(_CMD_PREFIXES):
+            colon = stripped.index(":") + (len(text) - len(stripped))
+            ranges.append((0, colon + 1, self.command_format))
+            return ranges
+        
+        # One scan over the line; plain words are classified separately
+        for match in self._TOKEN_RE.finditer(text):
+            kind = match.lastgroup
+            start = match.start()
+            if kind == 'word':
+                token_kind = _classify_token(match.group())
+                if token_kind is None:
                     continue
+                fmt = self._token_formats[token_kind]
+            else:
+                fmt = self._group_formats[kind]
+            end = match.end()
             
-            # Handle brackets (chords)
-            if text[pos] == '[':
-                self.setFormat(pos, 1, self.bracket_format)
-                pos += 1
-                continue
-            if text[pos] == ']':
-                self.setFormat(pos, 1, self.bracket_format)
-                pos += 1
-                continue
-            
-            # Handle barlines
-            if text[pos] == '|':
-                bar_end = pos
-                while bar_end < len(text) and text[bar_end] == '|':
-                    bar_end += 1
-                self.setFormat(pos, bar_end - pos, self.barline_format)
-                pos = bar_end
-                continue
-            
-            # Find token end
-            token_end = pos
-            while token_end < len(text) and not text[token_end].isspace():
-                if text[token_end] in '"[]|':
-                    break
-                token_end += 1
-            
-            token = text[pos:token_end]
-            
-            # Rest
-            if token.lower() == 'r' or token.lower() == 'rest':
-                self.setFormat(pos, len(token), self.rest_format)
-            # Pitch (note)
-            elif re.match(r'^[A-Ga-g][#b]{0,2}\d$', token):
-                self.setFormat(pos, len(token), self.pitch_format)
-            # Duration
-            elif re.match(r'^[whqest]\.?$', token, re.IGNORECASE):
-                self.setFormat(pos, len(token), self.duration_format)
-            # Barline words
-            elif token.lower() == 'measure':
-                self.setFormat(pos, len(token), self.barline_format)
-            
-            pos = token_end
+            # Extend the previous range over a run of same-format tokens
+            # (whitespace between them takes the format invisibly)
+            if ranges:
+                prev_start, prev_length, prev_fmt = ranges[-1]
+                prev_end = prev_start + prev_length
+                if prev_fmt is fmt and (prev_end == start or text[prev_end:start].isspace()):
+                    ranges[-1] = (prev_start, end - prev_start, fmt)
+                    continue
+            ranges.append((start, end - start, fmt))
+        
+        return ranges
+
+
+def _format_element(elem: ParsedElement) -> Optional[str]:
+    """Preview text for one parsed element, or None if it has none."""
+    if isinstance(elem, ParsedNote):
+        key = ("note", elem.pitch, elem.duration, elem.dotted, elem.lyric)
+    elif isinstance(elem, ParsedRest):
+        key = ("rest", elem.duration, elem.dotted)
+    elif isinstance(elem, ParsedChord):
+        key = ("chord", tuple(n.pitch for n in elem.notes), elem.duration, elem.lyric)
+    elif isinstance(elem, ParsedBarline):
+        key = ("barline", elem.style)
+    elif isinstance(elem, ParsedCommand):
+        key = ("command", elem.command, elem.value)
+    else:
+        return None
+    return _format_element_key(key)
+
+
+@lru_cache(maxsize=4096)
+def _format_element_key(key: tuple) -> str:
+    """
+    Format an element from its structural key.
+    
+    Parsed elements are mutable dataclasses and cannot be cached
+    directly, but equal keys always produce equal text.
+    """
+    kind = key[0]
+    
+    if kind == "note":
+        _, pitch, duration, dotted, lyric = key
+        s = f"♪ {pitch}"
+        if duration != duration.QUARTER:
+            s += f"({duration.value})"
+        if dotted:
+            s += "."
+        if lyric:
+            s += f' "{lyric}"'
+        return s
+    
+    if kind == "rest":
+        _, duration, dotted = key
+        s = f"𝄽 rest({duration.value})"
+        if dotted:
+            s += "."
+        return s
+    
+    if kind == "chord":
+        _, pitches, duration, lyric = key
+        s = f"🎵 [{' '.join(pitches)}]({duration.value})"
+        if lyric:
+            s += f' "{lyric}"'
+        return s
+    
+    if kind == "barline":
+        style = key[1]
+        if style == "double":
+            return "║"
+        elif style == "final":
+            return "𝄂"
+        return "│"
+    
+    _, command, value = key
+    return f"⚙ {command}={value}"
 
 
 class CommandInputPanel(QWidget):
@@ -178,19 +376,41 @@ class CommandInputPanel(QWidget):
     - Help documentation
     
     Signals:
-        commands_parsed: Emitted when valid commands are parsed
+        commands_parsed: Emitted (queued, after the parse returns) when
+            the parsed commands change
         apply_requested: Emitted when user wants to apply commands to score
     """
     
     commands_parsed = Signal(list)  # list of ParsedElement
     apply_requested = Signal(list)  # list of ParsedElement to add to score
     
+    # Idle time after the last keystroke before the text is re-parsed
+    PARSE_DELAY_MS = 150
+    
+    # Elements shown in the preview before it is truncated
+    PREVIEW_LIMIT = 200
+    
+    # format_help() output, shared by all panels
+    _HELP_TEXT: Optional[str] = None
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self.parser = CommandParser()
         self._last_parsed: list[ParsedElement] = []
         
+        # Last preview/status shown, so unchanged results skip the setters
+        self._preview_text = ""
+        self._status_text: Optional[str] = None
+        self._status_style: Optional[str] = None
+        self._help_dialog: Optional[QDialog] = None
+        
+        # Parse once typing pauses rather than on every keystroke
+        self._parse_timer = QTimer(self)
+        self._parse_timer.setSingleShot(True)
+        self._parse_timer.setInterval(self.PARSE_DELAY_MS)
+        self._parse_timer.timeout.connect(self._do_parse)
+        
         self._setup_ui()
         self._setup_completer()
         self._connect_signals()
@@ -247,12 +467,7 @@ class CommandInputPanel(QWidget):
         )
         
         # Set monospace font (use platform-appropriate font)
-        font = QFont("Menlo")  # macOS default monospace
-        if not font.exactMatch():
-            font = QFont("Consolas")  # Windows fallback
-        if not font.exactMatch():
-            font.setStyleHint(QFont.StyleHint.Monospace)
-        font.setPointSize(12)
+        font = _get_mono_font()
         self.editor.setFont(font)
         
         # Add syntax highlighter
@@ -329,40 +544,15 @@ class CommandInputPanel(QWidget):
         for name, snippet in snippets:
             action = menu.addAction(name)
             action.setData(snippet)
-            action.triggered.connect(
-                lambda checked, s=snippet: self._insert_snippet(s)
-            )
+        
+        # One connection for the whole menu; the snippet rides on the action
+        menu.triggered.connect(self._on_snippet_triggered)
         
         self.snippet_btn.setMenu(menu)
     
     def _setup_completer(self):
         """Set up auto-completion."""
-        completions = [
-            # Pitches
-            "C4", "D4", "E4", "F4", "G4", "A4", "B4",
-            "C5", "D5", "E5", "F5", "G5", "A5", "B5",
-            "C3", "D3", "E3", "F3", "G3", "A3", "B3",
-            # Accidentals
-            "C#4", "D#4", "F#4", "G#4", "A#4",
-            "Db4", "Eb4", "Gb4", "Ab4", "Bb4",
-            # Durations
-            "w", "h", "q", "e", "s",
-            "w.", "h.", "q.", "e.", "s.",
-            # Commands
-            "key:", "time:", "tempo:", "clef:",
-            "key: C major", "key: G major", "key: D major",
-            "key: A minor", "key: E minor",
-            "time: 4/4", "time: 3/4", "time: 6/8", "time: 2/4",
-            "tempo: 60", "tempo: 80", "tempo: 100", "tempo: 120",
-            "clef: treble", "clef: bass", "clef: alto",
-            # Rests
-            "r", "r q", "r h", "r w", "r e",
-            # Barlines
-            "|", "||", "|||", "measure",
-        ]
-        
-        model = QStringListModel(completions)
-        self.completer = QCompleter(model, self)
+        self.completer = QCompleter(_get_completion_model(), self)
         self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
     
@@ -371,86 +561,119 @@ class CommandInputPanel(QWidget):
         self.editor.textChanged.connect(self._on_text_changed)
     
     def _on_text_changed(self):
-        """Handle text changes - parse and update preview."""
+        """Handle text changes - (re)start the parse countdown."""
+        self._parse_timer.start()
+    
+    def _flush_pending_parse(self):
+        """Parse immediately if a debounced parse is still pending."""
+        if self._parse_timer.isActive():
+            self._parse_timer.stop()
+            self._do_parse()
+    
+    def _do_parse(self):
+        """Parse the editor text and update the preview."""
         text = self.editor.toPlainText()
         
         if not text.strip():
-            self.preview.clear()
-            self.status_label.setText("Ready")
+            self._set_preview("")
+            self._set_status("Ready")
             self._last_parsed = []
             return
         
         try:
             elements = self.parser.parse(text)
+            changed = elements != self._last_parsed
             self._last_parsed = elements
             
             # Update preview
-            preview_text = self._format_preview(elements)
-            self.preview.setPlainText(preview_text)
+            self._set_preview(self._format_preview(elements))
             
             # Update status
-            note_count = sum(1 for e in elements if isinstance(e, (ParsedNote, ParsedChord)))
-            rest_count = sum(1 for e in elements if isinstance(e, ParsedRest))
+            note_count = rest_count = 0
+            for e in elements:
+                t = type(e)
+                if t is ParsedNote or t is ParsedChord:
+                    note_count += 1
+                elif t is ParsedRest:
+                    rest_count += 1
             
             if self.parser.errors:
-                self.status_label.setText(
+                self._set_status(
                     f"⚠️ {len(self.parser.errors)} error(s) | "
-                    f"{note_count} notes, {rest_count} rests"
+                    f"{note_count} notes, {rest_count} rests",
+                    "color: #FFA500; font-size: 11px;"  # Orange
                 )
-                self.status_label.setStyleSheet("color: #FFA500; font-size: 11px;")  # Orange
             else:
-                self.status_label.setText(
-                    f"✓ Valid | {note_count} notes, {rest_count} rests"
+                self._set_status(
+                    f"✓ Valid | {note_count} notes, {rest_count} rests",
+                    "color: #4CAF50; font-size: 11px;"  # Green
                 )
-                self.status_label.setStyleSheet("color: #4CAF50; font-size: 11px;")  # Green
             
-            self.commands_parsed.emit(elements)
+            # Edits that parse to the same elements (e.g. extra spaces)
+            # need no downstream update. Deliver on the next event-loop
+            # pass so slow receivers never delay the editor.
+            if changed:
+                QTimer.singleShot(0, self, lambda: self.commands_parsed.emit(elements))
             
         except Exception as e:
             logger.exception("Parse error")
-            self.status_label.setText(f"❌ Error: {e}")
-            self.status_label.setStyleSheet("color: #FF6B6B; font-size: 11px;")  # Light red
-    
-    def _format_preview(self, elements: list[ParsedElement]) -> str:
-        """Format parsed elements for preview display."""
-        parts = []
-        
-        for elem in elements:
-            if isinstance(elem, ParsedNote):
-                s = f"♪ {elem.pitch}"
-                if elem.duration != elem.duration.QUARTER:
-                    s += f"({elem.duration.value})"
-                if elem.dotted:
-                    s += "."
-                if elem.lyric:
-                    s += f' "{elem.lyric}"'
-                parts.append(s)
-            
-            elif isinstance(elem, ParsedRest):
-                s = f"𝄽 rest({elem.duration.value})"
-                if elem.dotted:
-                    s += "."
-                parts.append(s)
-            
-            elif isinstance(elem, ParsedChord):
-                pitches = " ".join(n.pitch for n in elem.notes)
-                s = f"🎵 [{pitches}]({elem.duration.value})"
-                if elem.lyric:
-                    s += f' "{elem.lyric}"'
-                parts.append(s)
-            
-            elif isinstance(elem, ParsedBarline):
-                if elem.style == "double":
-                    parts.append("║")
-                elif elem.style == "final":
-                    parts.append("𝄂")
-                else:
-                    parts.append("│")
+            self._set_status(f"❌ Error: {e}", "color: #FF6B6B; font-size: 11px;")  # Light red
+    
+    def _set_preview(self, text: str):
+        """Show preview text, skipping the update if it is unchanged."""
+        if text != self._preview_text:
+            self._preview_text = text
+            self.preview.setPlainText(text)
+    
+    def _set_status(self, text: str, style: Optional[str] = None):
+        """
+        Show a status message, touching only what actually changed.
+        
+        Args:
+            text: Status text
+            style: Style sheet for the label, or None to keep the current one
+        """
+        if text != self._status_text:
+            self._status_text = text
+            self.status_label.setText(text)
+        if style is not None and style != self._status_style:
+            self._status_style = style
+            self.status_label.setStyleSheet(style)
+    
+    def _format_preview(
+        self,
+        elements: list[ParsedElement],
+        limit: int = PREVIEW_LIMIT
+    ) -> str:
+        """
+        Format parsed elements for preview display.
+        
+        Args:
+            elements: Parsed elements
+            limit: Maximum number of elements to format; the preview
+                box only shows a few lines, so the rest is summarized
             
-            elif isinstance(elem, ParsedCommand):
-                parts.append(f"⚙ {elem.command}={elem.value}")
-        
-        return " ".join(parts)
+        Returns:
+            Preview text
+        """
+        buf = io.StringIO()
+        separator = ""
+        
+        for elem in islice(elements, limit):
+            text = _format_element(elem)
+            if text is not None:
+                buf.write(separator)
+                buf.write(text)
+                separator = " "
+        
+        if len(elements) > limit:
+            buf.write(f"{separator}… (+{len(elements) - limit} more)")
+        
+        return buf.getvalue()
+    
+    def _on_snippet_triggered(self, action):
+        """Insert the snippet stored on a triggered menu action."""
+        self._insert_snippet(action.data())
     
     def _insert_snippet(self, snippet: str):
         """Insert a snippet at cursor position."""
@@ -466,9 +689,10 @@ class CommandInputPanel(QWidget):
     def _on_clear(self):
         """Clear the editor."""
         self.editor.clear()
-        self.preview.clear()
-        self.status_label.setText("Ready")
-        self.status_label.setStyleSheet("color: #666;")
+        self._parse_timer.stop()
+        self._last_parsed = []
+        self._set_preview("")
+        self._set_status("Ready", "color: #666;")
     
     def _on_validate(self):
         """Validate current input and show detailed errors."""
@@ -501,6 +725,7 @@ class CommandInputPanel(QWidget):
     
     def _on_apply(self):
         """Apply parsed commands to the score."""
+        self._flush_pending_parse()
         if not self._last_parsed:
             QMessageBox.warning(
                 self, "No Content",
@@ -512,30 +737,50 @@ class CommandInputPanel(QWidget):
     
     def _show_help(self):
         """Show help documentation."""
-        help_text = format_help()
+        if self._help_dialog is None:
+            self._help_dialog = self._create_help_dialog()
+        
+        self._help_dialog.show()
+        self._help_dialog.raise_()
+        self._help_dialog.activateWindow()
+    
+    def _create_help_dialog(self) -> QDialog:
+        """Build the help dialog (once per panel)."""
+        if CommandInputPanel._HELP_TEXT is None:
+            CommandInputPanel._HELP_TEXT = format_help()
         
-        dialog = QMessageBox(self)
+        dialog = QDialog(self)
         dialog.setWindowTitle("Command Syntax Help")
-        dialog.setIcon(QMessageBox.Icon.Information)
-        dialog.setText("Music Command Syntax Guide")
-        dialog.setDetailedText(help_text)
-        dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
+        dialog.resize(700, 600)
+        layout = QVBoxLayout(dialog)
         
-        # Make detail text visible by default
-        for btn in dialog.buttons():
-            if dialog.buttonRole(btn) == QMessageBox.ButtonRole.ActionRole:
-                btn.click()
-                break
+        browser = QTextBrowser()
+        browser.setFont(_get_mono_font())
+        browser.setLineWrapMode(QTextBrowser.LineWrapMode.NoWrap)
+        browser.setPlainText(CommandInputPanel._HELP_TEXT)
+        layout.addWidget(browser)
         
-        dialog.exec()
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
+        button_box.accepted.connect(dialog.accept)
+        layout.addWidget(button_box)
+        
+        return dialog
     
     def get_parsed_elements(self) -> list[ParsedElement]:
         """Get the currently parsed elements."""
+        self._flush_pending_parse()
         return self._last_parsed
     
     def set_text(self, text: str):
         """Set the editor text."""
-        self.editor.setPlainText(text)
+        # Parse once, directly, instead of via textChanged and the timer
+        self.editor.blockSignals(True)
+        try:
+            self.editor.setPlainText(text)
+        finally:
+            self.editor.blockSignals(False)
+        self._parse_timer.stop()
+        self._do_parse()
     
     def get_text(self) -> str:
         """Get the editor text."""
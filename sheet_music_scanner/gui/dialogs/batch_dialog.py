@@ -7,24 +7,177 @@ Provides file selection, progress tracking, and result display.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+import os
+from typing import AbstractSet, Iterable, List, Optional, Set, Tuple
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QListWidget, QListWidgetItem, QProgressBar, QFileDialog,
+    QListView, QProgressBar, QFileDialog,
     QComboBox, QGroupBox, QFormLayout, QCheckBox, QSpinBox,
     QTabWidget, QWidget, QTextEdit, QSplitter, QMessageBox,
     QAbstractItemView,
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QAbstractListModel, QModelIndex,
+)
 from PySide6.QtGui import QColor, QBrush
 
+from sheet_music_scanner.config import get_config
 from sheet_music_scanner.core.batch_processor import (
     BatchProcessor, BatchJobItem, BatchJobResult, BatchJobStatus
 )
 from sheet_music_scanner.omr.processor import OMRProcessor
 
 
+def _iter_files(folder: Path, extensions: AbstractSet[str]) -> Iterable[Path]:
+    """
+    Yield the files directly in a folder whose extension is supported.
+    
+    One scandir pass replaces a glob per extension; matching is
+    case-insensitive and results are sorted by name.
+    
+    Args:
+        folder: Folder to scan (not recursive)
+        extensions: Lowercase extensions including the dot
+    """
+    with os.scandir(folder) as entries:
+        matches = [
+            entry for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in extensions
+            and entry.is_file()
+        ]
+    
+    for entry in sorted(matches, key=lambda e: e.name):
+        yield Path(entry.path)
+
+
+class FileListModel(QAbstractListModel):
+    """
+    List model of batch input files.
+    
+    Rows are kept as parallel plain lists (path, name, status, error)
+    instead of one QListWidgetItem per file, so large batches stay cheap
+    to hold and to bulk-insert.
+    """
+    
+    # Row backgrounds per status, shared by all rows
+    _BRUSHES = {
+        BatchJobStatus.PROCESSING: QBrush(QColor(255, 255, 200)),  # Yellow
+        BatchJobStatus.COMPLETED: QBrush(QColor(200, 255, 200)),  # Green
+        BatchJobStatus.FAILED: QBrush(QColor(255, 200, 200)),  # Red
+        BatchJobStatus.CANCELLED: QBrush(QColor(220, 220, 220)),  # Gray
+    }
+    
+    # Display-text prefix per status
+    _PREFIXES = {
+        BatchJobStatus.COMPLETED: "✓ ",
+        BatchJobStatus.FAILED: "✗ ",
+        BatchJobStatus.CANCELLED: "⊘ ",
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._paths: List[str] = []
+        self._names: List[str] = []
+        self._status: List[BatchJobStatus] = []
+        self._errors: List[Optional[str]] = []
+        
+        # Same paths as a set, for O(1) duplicate checks
+        self._path_set: Set[str] = set()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of files (the model is flat)."""
+        return 0 if parent.isValid() else len(self._paths)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Row data for the view."""
+        row = index.row()
+        if not index.isValid() or row >= len(self._paths):
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._PREFIXES.get(self._status[row], "") + self._names[row]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._BRUSHES.get(self._status[row])
+        if role == Qt.ItemDataRole.ToolTipRole:
+            error = self._errors[row]
+            return f"Error: {error}" if error is not None else self._paths[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._paths[row]
+        return None
+    
+    def add_paths(self, paths: Iterable[Path]) -> List[Path]:
+        """
+        Append files not already in the model, in one insert.
+        
+        Args:
+            paths: Files to add
+            
+        Returns:
+            The files that were added, in row order
+        """
+        new_paths = []
+        for filepath in paths:
+            path_str = str(filepath)
+            if path_str not in self._path_set:
+                self._path_set.add(path_str)
+                new_paths.append(filepath)
+        
+        if new_paths:
+            first = len(self._paths)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+            self._paths.extend(str(p) for p in new_paths)
+            self._names.extend(p.name for p in new_paths)
+            self._status.extend([BatchJobStatus.PENDING] * len(new_paths))
+            self._errors.extend([None] * len(new_paths))
+            self.endInsertRows()
+        
+        return new_paths
+    
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        """Remove the given rows."""
+        for row in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._path_set.discard(self._paths[row])
+            del self._paths[row], self._names[row], self._status[row], self._errors[row]
+            self.endRemoveRows()
+    
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.beginResetModel()
+        self._paths.clear()
+        self._names.clear()
+        self._status.clear()
+        self._errors.clear()
+        self._path_set.clear()
+        self.endResetModel()
+    
+    def paths(self) -> List[Path]:
+        """All file paths, in row order."""
+        return [Path(p) for p in self._paths]
+    
+    def set_status(self, row: int, status: BatchJobStatus, error: Optional[str] = None) -> None:
+        """Set a row's status, repainting it only if something changed."""
+        if row >= len(self._paths):
+            return
+        if self._status[row] == status and self._errors[row] == error:
+            return
+        
+        self._status[row] = status
+        self._errors[row] = error
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+    
+    def reset_statuses(self) -> None:
+        """Mark every row pending again."""
+        if not self._paths:
+            return
+        self._status = [BatchJobStatus.PENDING] * len(self._paths)
+        self._errors = [None] * len(self._paths)
+        self.dataChanged.emit(self.index(0), self.index(len(self._paths) - 1))
+
+
 class BatchProcessDialog(QDialog):
     """
     Dialog for batch processing files.
@@ -39,6 +192,20 @@ class BatchProcessDialog(QDialog):
     # Signals
     processing_complete = Signal(object)  # BatchJobResult
     
+    # Worker-thread events, delivered to the main thread by Qt's queue
+    _item_started = Signal(int, object)  # index, BatchJobItem
+    _item_completed = Signal(int, object)  # index, BatchJobItem
+    _job_completed = Signal(object)  # BatchJobResult
+    
+    # How often worker updates are flushed to the widgets (~30 Hz)
+    UI_UPDATE_INTERVAL_MS = 33
+    
+    # Auto-scroll follows the running item only every N items
+    AUTO_SCROLL_EVERY = 16
+    
+    # File dialog filter, built on first use
+    _FILE_FILTER: Optional[str] = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -46,9 +213,34 @@ class BatchProcessDialog(QDialog):
         self.setMinimumSize(700, 500)
         self.resize(800, 600)
         
-        self._processor = BatchProcessor()
+        self._processor = BatchProcessor(max_workers=get_config().omr.batch_workers)
         self._output_dir: Optional[Path] = None
         
+        # Lower-case extensions accepted when scanning folders
+        self._supported_exts = frozenset(
+            ext.lower() for ext in OMRProcessor.get_supported_formats()
+        )
+        
+        # Progress ticks are only recorded here; _ui_timer shows the latest
+        # (index, progress) on the main thread
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._current_index = -1
+        
+        # Last overall value written, to skip identical updates
+        self._finished_count = 0
+        
+        # Set once a run finishes: the next start re-queues every item
+        self._needs_requeue = False
+        
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(self.UI_UPDATE_INTERVAL_MS)
+        self._ui_timer.timeout.connect(self._apply_pending_progress)
+        
+        queued = Qt.ConnectionType.QueuedConnection
+        self._item_started.connect(self._update_item_started, queued)
+        self._item_completed.connect(self._update_item_completed, queued)
+        self._job_completed.connect(self._show_results, queued)
+        
         self._setup_ui()
         self._connect_signals()
     
@@ -99,7 +291,10 @@ class BatchProcessDialog(QDialog):
         file_layout = QVBoxLayout(file_group)
         
         # File list
-        self.file_list = QListWidget()
+        self.file_model = FileListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
+        self.file_list.setUniformItemSizes(True)
         self.file_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.file_list.setAlternatingRowColors(True)
         file_layout.addWidget(self.file_list)
@@ -123,6 +318,9 @@ class BatchProcessDialog(QDialog):
         clear_btn.clicked.connect(self._on_clear_files)
         file_btn_layout.addWidget(clear_btn)
         
+        # The processor's items mirror the list; keep it fixed while running
+        self._file_buttons = (add_files_btn, add_folder_btn, remove_btn, clear_btn)
+        
         file_btn_layout.addStretch()
         file_layout.addLayout(file_btn_layout)
         
@@ -165,6 +363,26 @@ class BatchProcessDialog(QDialog):
         self.status_label = QLabel("Ready")
         progress_layout.addWidget(self.status_label)
         
+        self.summary_label = QLabel()
+        self.summary_label.setTextFormat(Qt.TextFormat.RichText)
+        self.summary_label.hide()
+        progress_layout.addWidget(self.summary_label)
+        
+        options_layout = QHBoxLayout()
+        
+        self.auto_scroll_check = QCheckBox("Auto-scroll")
+        self.auto_scroll_check.setChecked(True)
+        self.auto_scroll_check.setToolTip("Keep the file being processed in view")
+        options_layout.addWidget(self.auto_scroll_check)
+        
+        self.summary_dialog_check = QCheckBox("Show summary dialog")
+        self.summary_dialog_check.setChecked(get_config().gui.show_batch_summary_dialog)
+        self.summary_dialog_check.toggled.connect(self._on_summary_dialog_toggled)
+        options_layout.addWidget(self.summary_dialog_check)
+        
+        options_layout.addStretch()
+        progress_layout.addLayout(options_layout)
+        
         layout.addWidget(progress_group)
         
         return widget
@@ -196,16 +414,19 @@ class BatchProcessDialog(QDialog):
     
     def _on_add_files(self):
         """Add files to the list."""
-        formats = " ".join(f"*{ext}" for ext in OMRProcessor.get_supported_formats())
+        cls = type(self)
+        if cls._FILE_FILTER is None:
+            formats = " ".join(f"*{ext}" for ext in OMRProcessor.get_supported_formats())
+            cls._FILE_FILTER = f"Image Files ({formats});;All Files (*)"
+        
         files, _ = QFileDialog.getOpenFileNames(
             self,
             "Select Files",
             "",
-            f"Image Files ({formats});;All Files (*)"
+            cls._FILE_FILTER
         )
         
-        for filepath in files:
-            self._add_file(Path(filepath))
+        self._add_files((Path(filepath) for filepath in files), validate=True)
     
     def _on_add_folder(self):
         """Add all files from a folder."""
@@ -214,34 +435,32 @@ class BatchProcessDialog(QDialog):
         )
         
         if folder:
-            folder_path = Path(folder)
-            for ext in OMRProcessor.get_supported_formats():
-                for filepath in folder_path.glob(f"*{ext}"):
-                    self._add_file(filepath)
-    
-    def _add_file(self, filepath: Path):
-        """Add a single file to the list."""
-        # Check if already added
-        for i in range(self.file_list.count()):
-            if self.file_list.item(i).data(Qt.ItemDataRole.UserRole) == str(filepath):
-                return
-        
-        item = QListWidgetItem(filepath.name)
-        item.setData(Qt.ItemDataRole.UserRole, str(filepath))
-        item.setToolTip(str(filepath))
-        self.file_list.addItem(item)
-        
+            # Just listed from the filesystem; skip the existence check
+            self._add_files(_iter_files(Path(folder), self._supported_exts), validate=False)
+    
+    def _add_files(self, paths: Iterable[Path], validate: bool):
+        """Add files to the list and the processor, with one insert and one count update."""
+        new_paths = self.file_model.add_paths(paths)
+        first = len(self._processor.items)
+        self._processor.add_files(new_paths, validate=validate)
+        
+        # Show files rejected by validation right away
+        for row, item in enumerate(self._processor.items[first:], first):
+            if item.status == BatchJobStatus.FAILED:
+                self.file_model.set_status(row, item.status, item.error_message)
         self._update_file_count()
     
     def _on_remove_selected(self):
         """Remove selected files."""
-        for item in self.file_list.selectedItems():
-            self.file_list.takeItem(self.file_list.row(item))
+        rows = [index.row() for index in self.file_list.selectionModel().selectedRows()]
+        self.file_model.remove_rows(rows)
+        self._processor.remove_items(rows)
         self._update_file_count()
     
     def _on_clear_files(self):
         """Clear all files."""
-        self.file_list.clear()
+        self.file_model.clear()
+        self._processor.clear()
         self._update_file_count()
     
     def _on_browse_output(self):
@@ -256,14 +475,14 @@ class BatchProcessDialog(QDialog):
     
     def _update_file_count(self):
         """Update file count display."""
-        count = self.file_list.count()
+        count = self.file_model.rowCount()
         self.overall_progress.setMaximum(max(1, count))
         self.overall_progress.setValue(0)
         self.start_btn.setEnabled(count > 0)
     
     def _on_start(self):
         """Start batch processing."""
-        if self.file_list.count() == 0:
+        if self.file_model.rowCount() == 0:
             QMessageBox.warning(self, "No Files", "Please add files to process.")
             return
         
@@ -271,12 +490,12 @@ class BatchProcessDialog(QDialog):
             QMessageBox.warning(self, "No Output", "Please select an output directory.")
             return
         
-        # Collect files
-        self._processor.clear()
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            filepath = Path(item.data(Qt.ItemDataRole.UserRole))
-            self._processor.add_files([filepath])
+        # The processor's items were added alongside the rows, in row
+        # order (callbacks index rows by position). A re-run starts them
+        # over, re-checking files that may have been moved or restored
+        if self._needs_requeue:
+            self._processor.requeue()
+            self._needs_requeue = False
         
         # Set output format
         format_map = {
@@ -290,14 +509,20 @@ class BatchProcessDialog(QDialog):
         # Update UI
         self.start_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
+        for button in self._file_buttons:
+            button.setEnabled(False)
         self.overall_progress.setValue(0)
         self.status_label.setText("Processing...")
+        self.summary_label.hide()
+        self._finished_count = 0
         
         # Reset item colors
-        for i in range(self.file_list.count()):
-            self.file_list.item(i).setBackground(QBrush())
+        self.file_model.reset_statuses()
         
         # Start processing
+        self._pending_progress = None
+        self._current_index = -1
+        self._ui_timer.start()
         self._processor.process_omr()
     
     def _on_cancel(self):
@@ -306,54 +531,71 @@ class BatchProcessDialog(QDialog):
         self.cancel_btn.setEnabled(False)
         self.status_label.setText("Cancelling...")
     
+    def _apply_pending_progress(self):
+        """Show the latest progress if it is for the item being displayed."""
+        pending = self._pending_progress
+        if pending is not None:
+            index, progress = pending
+            if index == self._current_index and progress != self.current_progress.value():
+                self.current_progress.setValue(progress)
+    
     def _on_item_started(self, index: int, item: BatchJobItem):
         """Handle item started."""
-        QTimer.singleShot(0, lambda: self._update_item_started(index, item))
+        self._item_started.emit(index, item)
     
     def _update_item_started(self, index: int, item: BatchJobItem):
         """Update UI for item started (main thread)."""
-        self.status_label.setText(f"Processing: {item.input_path.name}")
+        self._apply_pending_progress()
+        self._current_index = index
+        self.status_label.setText(f"Processing: {item.display_name}")
         self.current_progress.setValue(0)
         
-        if index < self.file_list.count():
-            list_item = self.file_list.item(index)
-            list_item.setBackground(QBrush(QColor(255, 255, 200)))  # Yellow
-            self.file_list.scrollToItem(list_item)
+        if index < self.file_model.rowCount():
+            self.file_model.set_status(index, BatchJobStatus.PROCESSING)
+            
+            # Scrolling costs a layout pass; skip it when nobody can see it
+            if (
+                self.auto_scroll_check.isChecked()
+                and self.file_list.isVisible()
+                and index % self.AUTO_SCROLL_EVERY == 0
+            ):
+                self.file_list.scrollTo(
+                    self.file_model.index(index),
+                    QAbstractItemView.ScrollHint.PositionAtCenter,
+                )
     
     def _on_item_progress(self, index: int, progress: int):
         """Handle item progress."""
-        QTimer.singleShot(0, lambda: self.current_progress.setValue(progress))
+        self._pending_progress = (index, progress)
     
     def _on_item_completed(self, index: int, item: BatchJobItem):
         """Handle item completed."""
-        QTimer.singleShot(0, lambda: self._update_item_completed(index, item))
+        self._item_completed.emit(index, item)
     
     def _update_item_completed(self, index: int, item: BatchJobItem):
         """Update UI for item completed (main thread)."""
-        self.overall_progress.setValue(index + 1)
-        
-        if index < self.file_list.count():
-            list_item = self.file_list.item(index)
-            
-            if item.status == BatchJobStatus.COMPLETED:
-                list_item.setBackground(QBrush(QColor(200, 255, 200)))  # Green
-                list_item.setText(f"✓ {item.input_path.name}")
-            elif item.status == BatchJobStatus.FAILED:
-                list_item.setBackground(QBrush(QColor(255, 200, 200)))  # Red
-                list_item.setText(f"✗ {item.input_path.name}")
-                list_item.setToolTip(f"Error: {item.error_message}")
-            elif item.status == BatchJobStatus.CANCELLED:
-                list_item.setBackground(QBrush(QColor(220, 220, 220)))  # Gray
-                list_item.setText(f"⊘ {item.input_path.name}")
+        # Count finished items: with parallel workers they finish out of order
+        self._finished_count += 1
+        if self._finished_count != self.overall_progress.value():
+            self.overall_progress.setValue(self._finished_count)
+        
+        # Unchanged rows are skipped by the model
+        error = item.error_message if item.status == BatchJobStatus.FAILED else None
+        self.file_model.set_status(index, item.status, error)
     
     def _on_job_completed(self, result: BatchJobResult):
         """Handle job completed."""
-        QTimer.singleShot(0, lambda: self._show_results(result))
+        self._job_completed.emit(result)
     
     def _show_results(self, result: BatchJobResult):
         """Show results summary."""
+        self._apply_pending_progress()
+        self._ui_timer.stop()
         self.start_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
+        for button in self._file_buttons:
+            button.setEnabled(True)
+        self._needs_requeue = True
         
         # Update status
         self.status_label.setText(
@@ -363,16 +605,32 @@ class BatchProcessDialog(QDialog):
             f"Time: {result.total_time:.1f}s"
         )
         
-        # Show summary dialog
-        QMessageBox.information(
-            self,
-            "Batch Processing Complete",
-            f"Processing complete!\n\n"
-            f"✓ Completed: {result.completed}\n"
-            f"✗ Failed: {result.failed}\n"
-            f"⊘ Cancelled: {result.cancelled}\n\n"
-            f"Total time: {result.total_time:.1f} seconds\n"
-            f"Success rate: {result.success_rate * 100:.1f}%"
+        # Inline summary; listeners are notified before any modal popup
+        self.summary_label.setText(
+            f"<b>Processing complete</b> &nbsp; "
+            f"✓ {result.completed} completed &nbsp; "
+            f"✗ {result.failed} failed &nbsp; "
+            f"⊘ {result.cancelled} cancelled &nbsp; "
+            f"({result.success_rate * 100:.1f}% in {result.total_time:.1f}s)"
         )
+        self.summary_label.show()
         
         self.processing_complete.emit(result)
+        
+        if get_config().gui.show_batch_summary_dialog:
+            QMessageBox.information(
+                self,
+                "Batch Processing Complete",
+                f"Processing complete!\n\n"
+                f"✓ Completed: {result.completed}\n"
+                f"✗ Failed: {result.failed}\n"
+                f"⊘ Cancelled: {result.cancelled}\n\n"
+                f"Total time: {result.total_time:.1f} seconds\n"
+                f"Success rate: {result.success_rate * 100:.1f}%"
+            )
+    
+    def _on_summary_dialog_toggled(self, checked: bool):
+        """Remember whether to pop up the summary after a run."""
+        config = get_config()
+        config.gui.show_batch_summary_dialog = checked
+        config.save()
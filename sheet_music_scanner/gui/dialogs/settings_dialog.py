@@ -4,7 +4,7 @@ Settings Dialog - Application settings configuration.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -13,11 +13,18 @@ from PySide6.QtWidgets import (
     QFormLayout, QDialogButtonBox, QTabWidget, QWidget,
     QLineEdit, QFileDialog, QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from sheet_music_scanner.config import Config
 
 
+# Config values in combo box order, and their reverse lookups
+_THEMES = ("system", "light", "dark")
+_THEME_INDEX = {theme: i for i, theme in enumerate(_THEMES)}
+_PAPER_SIZES = ("letter", "a4", "legal")
+_PAPER_SIZE_INDEX = {size: i for i, size in enumerate(_PAPER_SIZES)}
+
+
 class SettingsDialog(QDialog):
     """
     Settings dialog for configuring application options.
@@ -34,11 +41,30 @@ class SettingsDialog(QDialog):
         
         self.config = config
         
+        # Tool path -> is an existing file; re-checked at most once per path
+        self._path_exists_cache: Dict[str, bool] = {}
+        
+        # Re-check tool paths once typing pauses, not on every keystroke
+        self._tool_status_timer = QTimer(self)
+        self._tool_status_timer.setSingleShot(True)
+        self._tool_status_timer.setInterval(200)
+        self._tool_status_timer.timeout.connect(self._update_tool_status)
+        
         self.setWindowTitle("Settings")
         self.setModal(True)
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
         
+        # (label, build, load, apply) per tab; only the first tab is built
+        # up front, the rest the first time they are shown
+        self._tab_specs: List[Tuple[str, Callable[[], QWidget], Callable[[], None], Callable[[], None]]] = [
+            ("General", self._create_general_tab, self._load_general_settings, self._apply_general_settings),
+            ("OMR", self._create_omr_tab, self._load_omr_settings, self._apply_omr_settings),
+            ("Export", self._create_export_tab, self._load_export_settings, self._apply_export_settings),
+            ("External Tools", self._create_tools_tab, self._load_tools_settings, self._apply_tools_settings),
+        ]
+        self._tabs_built: Set[int] = set()
+        
         self._setup_ui()
         self._load_settings()
     
@@ -50,21 +76,11 @@ class SettingsDialog(QDialog):
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
         
-        # General tab
-        general_tab = self._create_general_tab()
-        self.tabs.addTab(general_tab, "General")
-        
-        # OMR tab
-        omr_tab = self._create_omr_tab()
-        self.tabs.addTab(omr_tab, "OMR")
-        
-        # Export tab
-        export_tab = self._create_export_tab()
-        self.tabs.addTab(export_tab, "Export")
-        
-        # Tools tab
-        tools_tab = self._create_tools_tab()
-        self.tabs.addTab(tools_tab, "External Tools")
+        # Placeholders; _build_tab swaps in the real page on first view
+        for label, *_ in self._tab_specs:
+            self.tabs.addTab(QWidget(), label)
+        self._build_tab(0)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Dialog buttons
         button_box = QDialogButtonBox(
@@ -79,6 +95,29 @@ class SettingsDialog(QDialog):
         )
         layout.addWidget(button_box)
     
+    def _on_tab_changed(self, index: int):
+        """Build and load a tab the first time it is shown."""
+        if index >= 0 and index not in self._tabs_built:
+            self._build_tab(index)
+            self._tab_specs[index][2]()
+    
+    def _build_tab(self, index: int):
+        """Replace a tab's placeholder with its real page."""
+        label, build, _, _ = self._tab_specs[index]
+        
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, build(), label)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        # removeTab() leaves the page alive (still parented to the tab widget)
+        placeholder.deleteLater()
+        
+        self._tabs_built.add(index)
+    
     def _create_general_tab(self) -> QWidget:
         """Create the general settings tab."""
         widget = QWidget()
@@ -249,6 +288,9 @@ class SettingsDialog(QDialog):
         self.musescore_status = QLabel()
         musescore_layout.addWidget(self.musescore_status)
         
+        self.lilypond_path_edit.textChanged.connect(self._tool_status_timer.start)
+        self.musescore_path_edit.textChanged.connect(self._tool_status_timer.start)
+        
         layout.addWidget(musescore_group)
         
         # Info
@@ -264,35 +306,38 @@ class SettingsDialog(QDialog):
         return widget
     
     def _load_settings(self):
-        """Load current settings into the dialog."""
-        # General
-        theme_index = ["system", "light", "dark"].index(
-            self.config.gui.theme.lower()
-        )
+        """Load current settings into the tabs built so far."""
+        for index in sorted(self._tabs_built):
+            self._tab_specs[index][2]()
+    
+    def _load_general_settings(self):
+        """Load general settings into the dialog."""
+        theme_index = _THEME_INDEX.get(self.config.gui.theme.lower(), 0)
         self.theme_combo.setCurrentIndex(theme_index)
         self.zoom_spin.setValue(int(self.config.gui.notation_zoom * 100))
         self.show_toolbar_check.setChecked(self.config.gui.show_toolbar)
         self.show_statusbar_check.setChecked(self.config.gui.show_statusbar)
         self.recent_max_spin.setValue(self.config.gui.recent_files_max)
-        
-        # OMR
+    
+    def _load_omr_settings(self):
+        """Load OMR settings into the dialog."""
         engine_index = 0 if self.config.omr.engine == "oemer" else 1
         self.omr_engine_combo.setCurrentIndex(engine_index)
         self.use_gpu_check.setChecked(self.config.omr.use_gpu)
         self.deskew_check.setChecked(self.config.omr.deskew_enabled)
         self.contrast_check.setChecked(self.config.omr.contrast_enhancement)
-        
-        # Export
+    
+    def _load_export_settings(self):
+        """Load export settings into the dialog."""
         self.midi_velocity_spin.setValue(self.config.export.midi_velocity)
         self.midi_tempo_spin.setValue(self.config.export.midi_tempo)
-        paper_index = ["letter", "a4", "legal"].index(
-            self.config.export.pdf_paper_size.lower()
-        )
+        paper_index = _PAPER_SIZE_INDEX.get(self.config.export.pdf_paper_size.lower(), 0)
         self.paper_size_combo.setCurrentIndex(paper_index)
         self.staff_size_spin.setValue(self.config.export.pdf_staff_size)
         self.include_lyrics_check.setChecked(self.config.export.include_lyrics_in_pdf)
-        
-        # Tools
+    
+    def _load_tools_settings(self):
+        """Load external tool paths into the dialog."""
         self.lilypond_path_edit.setText(self.config.lilypond_path or "")
         self.musescore_path_edit.setText(self.config.musescore_path or "")
         
@@ -301,7 +346,7 @@ class SettingsDialog(QDialog):
     def _update_tool_status(self):
         """Update the status of external tools."""
         lilypond_path = self.lilypond_path_edit.text()
-        if lilypond_path and Path(lilypond_path).exists():
+        if lilypond_path and self._path_exists(lilypond_path):
             self.lilypond_status.setText("✅ Found")
             self.lilypond_status.setStyleSheet("color: green;")
         elif lilypond_path:
@@ -312,7 +357,7 @@ class SettingsDialog(QDialog):
             self.lilypond_status.setStyleSheet("color: orange;")
         
         musescore_path = self.musescore_path_edit.text()
-        if musescore_path and Path(musescore_path).exists():
+        if musescore_path and self._path_exists(musescore_path):
             self.musescore_status.setText("✅ Found")
             self.musescore_status.setStyleSheet("color: green;")
         elif musescore_path:
@@ -322,33 +367,44 @@ class SettingsDialog(QDialog):
             self.musescore_status.setText("⚠️ Not configured")
             self.musescore_status.setStyleSheet("color: orange;")
     
+    def _path_exists(self, path: str) -> bool:
+        """Check (once per path) whether a tool path is an existing file."""
+        exists = self._path_exists_cache.get(path)
+        if exists is None:
+            exists = self._path_exists_cache[path] = Path(path).is_file()
+        return exists
+    
     def apply_settings(self):
-        """Apply settings to config."""
-        # General
-        self.config.gui.theme = ["system", "light", "dark"][
-            self.theme_combo.currentIndex()
-        ]
+        """Apply settings to config and save (tabs never opened keep their values)."""
+        with self.config.batch_update():
+            for index in sorted(self._tabs_built):
+                self._tab_specs[index][3]()
+    
+    def _apply_general_settings(self):
+        """Apply general settings to config."""
+        self.config.gui.theme = _THEMES[self.theme_combo.currentIndex()]
         self.config.gui.notation_zoom = self.zoom_spin.value() / 100.0
         self.config.gui.show_toolbar = self.show_toolbar_check.isChecked()
         self.config.gui.show_statusbar = self.show_statusbar_check.isChecked()
         self.config.gui.recent_files_max = self.recent_max_spin.value()
-        
-        # OMR
+    
+    def _apply_omr_settings(self):
+        """Apply OMR settings to config."""
         self.config.omr.engine = self.omr_engine_combo.currentData()
         self.config.omr.use_gpu = self.use_gpu_check.isChecked()
         self.config.omr.deskew_enabled = self.deskew_check.isChecked()
         self.config.omr.contrast_enhancement = self.contrast_check.isChecked()
-        
-        # Export
+    
+    def _apply_export_settings(self):
+        """Apply export settings to config."""
         self.config.export.midi_velocity = self.midi_velocity_spin.value()
         self.config.export.midi_tempo = self.midi_tempo_spin.value()
-        self.config.export.pdf_paper_size = ["letter", "a4", "legal"][
-            self.paper_size_combo.currentIndex()
-        ]
+        self.config.export.pdf_paper_size = _PAPER_SIZES[self.paper_size_combo.currentIndex()]
         self.config.export.pdf_staff_size = self.staff_size_spin.value()
         self.config.export.include_lyrics_in_pdf = self.include_lyrics_check.isChecked()
-        
-        # Tools
+    
+    def _apply_tools_settings(self):
+        """Apply external tool paths to config."""
         lilypond_path = self.lilypond_path_edit.text().strip()
         self.config.lilypond_path = lilypond_path if lilypond_path else None
         
@@ -6,21 +6,167 @@ Provides template selection, preview, and custom template creation.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Sequence, Tuple
+import logging
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QListWidget, QListWidgetItem, QGroupBox, QFormLayout,
+    QListView, QAbstractItemView, QGroupBox, QFormLayout,
     QLineEdit, QComboBox, QSpinBox, QTextEdit, QSplitter,
     QWidget, QMessageBox, QTabWidget, QTableWidget, QTableWidgetItem,
-    QHeaderView,
+    QHeaderView, QProgressDialog, QStyledItemDelegate, QTableView,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt, Signal, QModelIndex, QRegularExpression, QSortFilterProxyModel,
+    QThread, QTimer, QAbstractTableModel,
+)
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 from sheet_music_scanner.core.templates import (
-    get_template_manager, ScoreTemplate, PartTemplate, TemplateCategory
+    get_template_manager, ScoreTemplate, PartTemplate, TemplateCategory,
+    TemplateManager,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Choices offered in the create tab's parts table
+_CLEFS = ("treble", "bass", "alto", "tenor")
+_INSTRUMENTS = (
+    "", "Piano", "Violin", "Viola", "Violoncello",
+    "Clarinet", "Trumpet", "Soprano", "Alto", "Tenor", "Bass",
 )
 
+# Item role holding the template's category name, used for filtering
+_CATEGORY_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Item role holding preview strings, formatted when the model is built:
+# (tempo text, ((part name, clef, instrument), ...))
+_PREVIEW_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# Template list shared by every dialog, and the (manager, revision) it
+# was built from
+_TEMPLATE_MODEL: Optional[QStandardItemModel] = None
+_TEMPLATE_MODEL_KEY: Optional[Tuple[int, int]] = None
+
+
+def _get_template_model(manager: TemplateManager) -> QStandardItemModel:
+    """Get the shared template list model, rebuilding it if templates changed."""
+    global _TEMPLATE_MODEL, _TEMPLATE_MODEL_KEY
+    if _TEMPLATE_MODEL is None:
+        _TEMPLATE_MODEL = QStandardItemModel()
+    
+    key = (id(manager), manager.revision)
+    if key != _TEMPLATE_MODEL_KEY:
+        items = []
+        for template in manager.all_templates:
+            icon = "📄" if template.is_builtin else "📝"
+            item = QStandardItem(f"{icon} {template.name}")
+            item.setEditable(False)
+            item.setData(template, Qt.ItemDataRole.UserRole)
+            item.setData(template.category.value, _CATEGORY_ROLE)
+            item.setData((
+                f"{template.tempo_bpm} BPM",
+                tuple((p.name, p.clef, p.instrument or "-") for p in template.parts),
+            ), _PREVIEW_ROLE)
+            item.setToolTip(template.description)
+            items.append(item)
+        
+        _TEMPLATE_MODEL.setRowCount(0)
+        _TEMPLATE_MODEL.invisibleRootItem().appendRows(items)
+        _TEMPLATE_MODEL_KEY = key
+    
+    return _TEMPLATE_MODEL
+
+
+class PartsTableModel(QAbstractTableModel):
+    """
+    Read-only table of a template's parts for the preview pane.
+    
+    Holds the preformatted (name, clef, instrument) rows from the list
+    model, so showing a template is one model reset with no per-cell
+    items.
+    """
+    
+    HEADERS = ("Part Name", "Clef", "Instrument")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: Sequence[Tuple[str, str, str]] = ()
+    
+    def set_rows(self, rows: Sequence[Tuple[str, str, str]]) -> None:
+        """Replace the displayed rows."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class _ChoiceDelegate(QStyledItemDelegate):
+    """
+    Edit a table cell by picking from a fixed list.
+    
+    Cells hold plain text; a combo box exists only while a cell is being
+    edited, instead of one per row.
+    """
+    
+    def __init__(self, choices: Tuple[str, ...], parent=None):
+        super().__init__(parent)
+        self._choices = choices
+    
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.addItems(self._choices)
+        # Commit as soon as a choice is picked, not on focus loss
+        editor.activated.connect(lambda: self.commitData.emit(editor))
+        return editor
+    
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data() or "")
+    
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText())
+
+
+class _CreateFromScoreWorker(QThread):
+    """Background worker that derives a template from a score."""
+    
+    finished = Signal(object)  # ScoreTemplate
+    error = Signal(str)
+    
+    def __init__(self, manager: TemplateManager, score, name: str, description: str):
+        super().__init__()
+        self.manager = manager
+        self.score = score
+        self.name = name
+        self.description = description
+    
+    def run(self):
+        try:
+            template = self.manager.create_from_score(
+                self.score, self.name, self.description
+            )
+            self.finished.emit(template)
+            
+        except Exception as e:
+            logger.exception("Template creation worker error")
+            self.error.emit(str(e))
+
 
 class TemplateDialog(QDialog):
     """
@@ -36,6 +182,10 @@ class TemplateDialog(QDialog):
     # Signals
     template_selected = Signal(object)  # ScoreTemplate
     
+    # Quiet period before the preview follows the selection, so scrolling
+    # through the list with the arrow keys only renders where it stops
+    PREVIEW_DELAY_MS = 50
+    
     def __init__(self, parent=None, current_score=None):
         super().__init__(parent)
         
@@ -45,7 +195,17 @@ class TemplateDialog(QDialog):
         
         self._manager = get_template_manager()
         self._selected_template: Optional[ScoreTemplate] = None
+        self._selected_preview: Optional[Tuple[str, Tuple[Tuple[str, str, str], ...]]] = None
         self._current_score = current_score
+        self._from_score_worker: Optional[_CreateFromScoreWorker] = None
+        
+        # Template currently shown in the preview pane
+        self._previewed_template: Optional[ScoreTemplate] = None
+        
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self._apply_preview)
         
         self._setup_ui()
         self._populate_templates()
@@ -61,9 +221,14 @@ class TemplateDialog(QDialog):
         browse_tab = self._create_browse_tab()
         tabs.addTab(browse_tab, "📋 Browse Templates")
         
-        # Create tab
-        create_tab = self._create_create_tab()
-        tabs.addTab(create_tab, "➕ Create Template")
+        # Create tab: most users only pick a template, so its page is
+        # built the first time the tab is shown
+        self._create_page = QWidget()
+        self._create_page_layout = QVBoxLayout(self._create_page)
+        self._create_page_layout.setContentsMargins(0, 0, 0, 0)
+        tabs.addTab(self._create_page, "➕ Create Template")
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self._tabs = tabs
         
         layout.addWidget(tabs)
         
@@ -83,6 +248,11 @@ class TemplateDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _on_tab_changed(self, index: int):
+        """Build the Create tab the first time it is shown."""
+        if self._tabs.widget(index) is self._create_page and self._create_page_layout.isEmpty():
+            self._create_page_layout.addWidget(self._create_create_tab())
+    
     def _create_browse_tab(self) -> QWidget:
         """Create the browse templates tab."""
         widget = QWidget()
@@ -106,10 +276,16 @@ class TemplateDialog(QDialog):
         
         left_layout.addLayout(category_layout)
         
-        # Template list
-        self.template_list = QListWidget()
-        self.template_list.currentItemChanged.connect(self._on_template_selected)
-        self.template_list.itemDoubleClicked.connect(self._on_use_template)
+        # Template list: a category filter over the shared model
+        self._template_filter = QSortFilterProxyModel(self)
+        self._template_filter.setFilterRole(_CATEGORY_ROLE)
+        
+        self.template_list = QListView()
+        self.template_list.setModel(self._template_filter)
+        self.template_list.setUniformItemSizes(True)
+        self.template_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.template_list.selectionModel().currentChanged.connect(self._on_template_selected)
+        self.template_list.doubleClicked.connect(self._on_use_template)
         left_layout.addWidget(self.template_list)
         
         # Right: Preview
@@ -150,11 +326,11 @@ class TemplateDialog(QDialog):
         parts_group = QGroupBox("Parts")
         parts_layout = QVBoxLayout(parts_group)
         
-        self.parts_table = QTableWidget()
-        self.parts_table.setColumnCount(3)
-        self.parts_table.setHorizontalHeaderLabels(["Part Name", "Clef", "Instrument"])
+        self.parts_model = PartsTableModel(self)
+        self.parts_table = QTableView()
+        self.parts_table.setModel(self.parts_model)
         self.parts_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.parts_table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.parts_table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         parts_layout.addWidget(self.parts_table)
         
         right_layout.addWidget(parts_group)
@@ -221,6 +397,14 @@ class TemplateDialog(QDialog):
         self.create_parts_table.setColumnCount(3)
         self.create_parts_table.setHorizontalHeaderLabels(["Part Name", "Clef", "Instrument"])
         self.create_parts_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.create_parts_table.setItemDelegateForColumn(1, _ChoiceDelegate(_CLEFS, self))
+        self.create_parts_table.setItemDelegateForColumn(2, _ChoiceDelegate(_INSTRUMENTS, self))
+        self.create_parts_table.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.SelectedClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+            | QAbstractItemView.EditTrigger.AnyKeyPressed
+        )
         parts_layout.addWidget(self.create_parts_table)
         
         parts_btn_layout = QHBoxLayout()
@@ -243,9 +427,9 @@ class TemplateDialog(QDialog):
         create_btn_layout.addStretch()
         
         if self._current_score:
-            from_score_btn = QPushButton("Create from Current Score")
-            from_score_btn.clicked.connect(self._on_create_from_score)
-            create_btn_layout.addWidget(from_score_btn)
+            self.from_score_btn = QPushButton("Create from Current Score")
+            self.from_score_btn.clicked.connect(self._on_create_from_score)
+            create_btn_layout.addWidget(self.from_score_btn)
         
         save_template_btn = QPushButton("Save Template")
         save_template_btn.clicked.connect(self._on_save_template)
@@ -260,50 +444,53 @@ class TemplateDialog(QDialog):
     
     def _populate_templates(self):
         """Populate the template list."""
-        self.template_list.clear()
+        # Picks up added templates; a no-op if nothing changed
+        self._template_filter.setSourceModel(_get_template_model(self._manager))
         
         category = self.category_combo.currentData()
         
         if category:
-            templates = self._manager.get_by_category(category)
+            pattern = f"^{QRegularExpression.escape(category.value)}$"
+            self._template_filter.setFilterRegularExpression(pattern)
         else:
-            templates = self._manager.all_templates
-        
-        for template in templates:
-            icon = "📄" if template.is_builtin else "📝"
-            item = QListWidgetItem(f"{icon} {template.name}")
-            item.setData(Qt.ItemDataRole.UserRole, template)
-            item.setToolTip(template.description)
-            self.template_list.addItem(item)
+            self._template_filter.setFilterRegularExpression("")
     
     def _on_category_changed(self):
         """Handle category filter change."""
         self._populate_templates()
     
-    def _on_template_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
+    def _on_template_selected(self, current: QModelIndex, previous: QModelIndex):
         """Handle template selection."""
-        if not current:
+        if not current.isValid():
             self._selected_template = None
             self.use_btn.setEnabled(False)
+            self._preview_timer.stop()
             return
         
-        template = current.data(Qt.ItemDataRole.UserRole)
-        self._selected_template = template
+        # The selection itself is immediate so Use always takes what is
+        # highlighted; only the preview is deferred
+        self._selected_template = current.data(Qt.ItemDataRole.UserRole)
+        self._selected_preview = current.data(_PREVIEW_ROLE)
         self.use_btn.setEnabled(True)
+        self._preview_timer.start()
+    
+    def _apply_preview(self):
+        """Show the selected template in the preview pane."""
+        template = self._selected_template
+        if template is None or template is self._previewed_template:
+            return
+        self._previewed_template = template
         
         # Update preview
         self.preview_name.setText(template.name)
         self.preview_desc.setText(template.description)
         self.preview_time.setText(template.time_signature)
         self.preview_key.setText(template.key_signature)
-        self.preview_tempo.setText(f"{template.tempo_bpm} BPM")
+        tempo_text, part_rows = self._selected_preview
+        self.preview_tempo.setText(tempo_text)
         
         # Update parts table
-        self.parts_table.setRowCount(len(template.parts))
-        for i, part in enumerate(template.parts):
-            self.parts_table.setItem(i, 0, QTableWidgetItem(part.name))
-            self.parts_table.setItem(i, 1, QTableWidgetItem(part.clef))
-            self.parts_table.setItem(i, 2, QTableWidgetItem(part.instrument or "-"))
+        self.parts_model.set_rows(part_rows)
     
     def _on_use_template(self):
         """Use the selected template."""
@@ -316,21 +503,10 @@ class TemplateDialog(QDialog):
         row = self.create_parts_table.rowCount()
         self.create_parts_table.setRowCount(row + 1)
         
-        # Name
+        # Name, clef and instrument; the column delegates edit the last two
         self.create_parts_table.setItem(row, 0, QTableWidgetItem(f"Part {row + 1}"))
-        
-        # Clef combo
-        clef_combo = QComboBox()
-        clef_combo.addItems(["treble", "bass", "alto", "tenor"])
-        self.create_parts_table.setCellWidget(row, 1, clef_combo)
-        
-        # Instrument combo
-        instr_combo = QComboBox()
-        instr_combo.addItems([
-            "", "Piano", "Violin", "Viola", "Violoncello",
-            "Clarinet", "Trumpet", "Soprano", "Alto", "Tenor", "Bass"
-        ])
-        self.create_parts_table.setCellWidget(row, 2, instr_combo)
+        self.create_parts_table.setItem(row, 1, QTableWidgetItem(_CLEFS[0]))
+        self.create_parts_table.setItem(row, 2, QTableWidgetItem(_INSTRUMENTS[0]))
     
     def _on_remove_part(self):
         """Remove selected part from creation table."""
@@ -340,16 +516,48 @@ class TemplateDialog(QDialog):
     
     def _on_create_from_score(self):
         """Create template from current score."""
-        if not self._current_score:
+        if not self._current_score or self._from_score_worker:
             return
         
         name = self.name_edit.text().strip() or "My Template"
         desc = self.desc_edit.text().strip()
         
-        template = self._manager.create_from_score(
-            self._current_score, name, desc
+        # Walking a large score's parts can take a while; keep the UI live
+        progress = QProgressDialog("Analyzing score...", None, 0, 0, self)
+        progress.setWindowTitle("Create Template")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        self.from_score_btn.setEnabled(False)
+        
+        self._from_score_worker = _CreateFromScoreWorker(
+            self._manager, self._current_score, name, desc
         )
         
+        def on_finished(template: ScoreTemplate):
+            progress.close()
+            self._finish_create_from_score()
+            self._show_created_template(template)
+        
+        def on_error(error_msg: str):
+            progress.close()
+            self._finish_create_from_score()
+            QMessageBox.warning(
+                self, "Template Error",
+                f"Could not create a template from the score:\n{error_msg}"
+            )
+        
+        self._from_score_worker.finished.connect(on_finished)
+        self._from_score_worker.error.connect(on_error)
+        self._from_score_worker.start()
+    
+    def _finish_create_from_score(self):
+        """Release the worker and re-enable the button."""
+        self._from_score_worker.wait()
+        self._from_score_worker = None
+        self.from_score_btn.setEnabled(True)
+    
+    def _show_created_template(self, template: ScoreTemplate):
+        """Fill the create form from a template derived from the score."""
         # Update UI with template info
         self.time_combo.setCurrentText(template.time_signature)
         self.key_combo.setCurrentText(template.key_signature)
@@ -360,14 +568,11 @@ class TemplateDialog(QDialog):
             self._on_add_part()
             row = self.create_parts_table.rowCount() - 1
             self.create_parts_table.item(row, 0).setText(part.name)
-            
-            clef_combo = self.create_parts_table.cellWidget(row, 1)
-            if clef_combo:
-                clef_combo.setCurrentText(part.clef)
+            self.create_parts_table.item(row, 1).setText(part.clef)
         
         QMessageBox.information(
             self, "Template Created",
-            f"Template '{name}' created from current score.\n"
+            f"Template '{template.name}' created from current score.\n"
             "Click 'Save Template' to save it."
         )
     
@@ -388,11 +593,11 @@ class TemplateDialog(QDialog):
             name_item = self.create_parts_table.item(row, 0)
             part_name = name_item.text() if name_item else f"Part {row + 1}"
             
-            clef_combo = self.create_parts_table.cellWidget(row, 1)
-            clef = clef_combo.currentText() if clef_combo else "treble"
+            clef_item = self.create_parts_table.item(row, 1)
+            clef = clef_item.text() if clef_item else "treble"
             
-            instr_combo = self.create_parts_table.cellWidget(row, 2)
-            instr = instr_combo.currentText() if instr_combo else ""
+            instr_item = self.create_parts_table.item(row, 2)
+            instr = instr_item.text() if instr_item else ""
             
             parts.append(PartTemplate(name=part_name, clef=clef, instrument=instr))
         
@@ -19,6 +19,11 @@ from sheet_music_scanner.core.operations import (
 )
 
 
+# Static option lists, read once per process
+_INTERVALS = tuple(get_interval_options())
+_KEYS = tuple(get_available_keys())
+
+
 class TransposeDialog(QDialog):
     """
     Dialog for transposing a score.
@@ -57,8 +62,9 @@ class TransposeDialog(QDialog):
         interval_layout = QHBoxLayout()
         interval_layout.addSpacing(20)
         self.interval_combo = QComboBox()
-        for code, name in get_interval_options():
-            self.interval_combo.addItem(name, code)
+        self.interval_combo.addItems([name for _, name in _INTERVALS])
+        for i, (code, _) in enumerate(_INTERVALS):
+            self.interval_combo.setItemData(i, code)
         interval_layout.addWidget(self.interval_combo)
         method_layout.addLayout(interval_layout)
         
@@ -86,8 +92,7 @@ class TransposeDialog(QDialog):
         key_layout = QHBoxLayout()
         key_layout.addSpacing(20)
         self.key_combo = QComboBox()
-        for key_name in get_available_keys():
-            self.key_combo.addItem(key_name)
+        self.key_combo.addItems(_KEYS)
         key_layout.addWidget(self.key_combo)
         method_layout.addLayout(key_layout)
         
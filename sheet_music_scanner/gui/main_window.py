@@ -988,6 +988,9 @@ class MainWindow(QMainWindow):
                         if position.note_index < len(notes):
                             note_obj = notes[position.note_index]
                             note_obj.transpose(offset, inPlace=True)
+                            # Edited in place: drop the score's cached
+                            # MusicXML and note index
+                            self.current_score._mark_modified()
                             
                             self.status_bar.showMessage(
                                 f"Changed pitch by {offset} half steps", 2000
@@ -1072,7 +1075,6 @@ class MainWindow(QMainWindow):
         dialog = SettingsDialog(self.config, self)
         if dialog.exec():
             dialog.apply_settings()
-            self.config.save()
     
     def _on_set_theme(self, theme_name: str):
         """Set the application theme."""
@@ -2,12 +2,17 @@
 Main entry point for ScoreForge application.
 """
 
+import multiprocessing
 import sys
 from pathlib import Path
 
 
 def main():
     """Main entry point for the application."""
+    # In the frozen build, worker processes (PDF export) re-run this
+    # executable; hand them to multiprocessing before any GUI starts
+    multiprocessing.freeze_support()
+    
     # Import PySide6 here to allow CLI usage without GUI
     from PySide6.QtWidgets import QApplication
     from PySide6.QtCore import Qt
@@ -225,6 +225,26 @@ class TestCommandExecutor:
         assert len(chords) == 1
         assert len(chords[0].pitches) == 3
     
+    def test_add_elements_refreshes_score_caches(self):
+        """Test appending to a score invalidates its cached state."""
+        parser = CommandParser()
+        score = execute_commands(parser.parse("C4 q"))
+        
+        assert score.note_count == 1
+        cached = score.musicxml_bytes
+        
+        executor = CommandExecutor()
+        executor.add_elements_to_score(score, parser.parse("D4 q"))
+        assert score.note_count == 2
+        assert score.musicxml_bytes is not cached
+        
+        executor.add_elements_to_score(score, parser.parse("E4 h"), append=False)
+        assert score.note_count == 1
+        assert b"<step>E</step>" in score.musicxml_bytes
+        assert b"<step>C</step>" not in score.musicxml_bytes
+        assert score.is_modified
+        assert score.can_undo()
+    
     def test_duration_conversion(self):
         """Test that durations are converted correctly."""
         executor = CommandExecutor()
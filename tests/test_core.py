@@ -2,6 +2,7 @@
 Tests for Sheet Music Scanner core functionality.
 """
 
+import os
 import pytest
 from pathlib import Path
 import tempfile
@@ -98,6 +99,143 @@ class TestScore:
         score.redo()
         assert score.can_undo() is True
         assert score.can_redo() is False
+    
+    def test_iter_notes(self):
+        """Test iterating notes across parts and measures."""
+        from sheet_music_scanner.core.score import Score
+        from music21 import stream, note, chord, meter
+        
+        m21_score = stream.Score()
+        for pitch in ("C4", "E4"):
+            part = stream.Part()
+            for number in (1, 2):
+                measure = stream.Measure(number=number)
+                if number == 1:
+                    measure.append(meter.TimeSignature("4/4"))
+                measure.append(note.Note(pitch, quarterLength=2.0))
+                measure.append(chord.Chord(["C4", "G4"], quarterLength=1.0))
+                measure.append(note.Rest(quarterLength=1.0))
+                part.append(measure)
+            m21_score.append(part)
+        
+        score = Score.from_music21(m21_score)
+        notes = list(score.iter_notes())
+        
+        assert len(notes) == 12
+        assert [(n.part_index, n.measure_number) for n in notes[:4]] == [
+            (0, 1), (0, 1), (0, 1), (0, 2)
+        ]
+        assert notes[0].pitch == "C4"
+        assert notes[1].is_chord and notes[1].chord_pitches == ["C4", "G4"]
+        assert notes[2].is_rest and notes[2].beat == 4.0
+        assert notes[6].pitch == "E4"
+        
+        # Same result as the per-measure lookup
+        assert [n.pitch for n in notes[3:6]] == [
+            n.pitch for n in score.get_notes_in_measure(0, 2)
+        ]
+    
+    def test_note_count(self):
+        """Test the cached note count follows edits."""
+        from sheet_music_scanner.core.score import Score
+        from music21 import stream, note, chord
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        measure = stream.Measure(number=1)
+        measure.append(note.Note("C4", quarterLength=1.0))
+        measure.append(chord.Chord(["E4", "G4"], quarterLength=1.0))
+        measure.append(note.Rest(quarterLength=2.0))
+        part.append(measure)
+        m21_score.append(part)
+        
+        score = Score.from_music21(m21_score)
+        assert Score().note_count == 0
+        assert score.note_count == 2
+        
+        score.transpose(2)
+        assert score.note_count == 2
+        score.undo()
+        assert score.note_count == 2
+    
+    def test_musicxml_bytes_cached(self):
+        """Test serialized MusicXML is reused until the score changes."""
+        from sheet_music_scanner.core.score import Score
+        from music21 import stream, note
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        part.append(note.Note("C4", quarterLength=4.0))
+        m21_score.append(part)
+        
+        score = Score.from_music21(m21_score)
+        data = score.musicxml_bytes
+        assert score.musicxml_bytes is data
+        
+        score.title = "Cached"
+        assert score.musicxml_bytes is not data
+        assert b"Cached" in score.musicxml_bytes
+    
+    def test_find_by_key_after_undo(self):
+        """Test note keys stay valid after undo restores a copy."""
+        from sheet_music_scanner.core.score import Score
+        from music21 import stream, note, meter
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        measure = stream.Measure(number=1)
+        measure.append(meter.TimeSignature("4/4"))
+        measure.append(note.Note("C4", quarterLength=2.0))
+        measure.append(note.Note("D4", quarterLength=2.0))
+        part.append(measure)
+        m21_score.append(part)
+        
+        score = Score.from_music21(m21_score)
+        second = list(score.iter_notes())[1]
+        
+        score.add_lyric_to_note(0, 1, second.beat, "la")
+        assert score._find_by_key(second._element_id).lyric == "la"
+        
+        score.undo()
+        found = score._find_by_key(second._element_id)
+        assert found is not None
+        assert found.pitch == "D4"
+        assert found.lyric is None
+    
+    def test_undo_byte_budget(self):
+        """Test undo history is trimmed to the byte budget."""
+        from sheet_music_scanner.core.score import Score
+        from music21 import stream, note
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        measure = stream.Measure(number=1)
+        measure.append(note.Note("C4", quarterLength=4.0))
+        part.append(measure)
+        m21_score.append(part)
+        
+        score = Score.from_music21(m21_score)
+        score.transpose(1)
+        snapshot_size = score._undo_bytes
+        assert snapshot_size > 0
+        
+        # Room for roughly three snapshots
+        score._max_undo_bytes = snapshot_size * 3
+        for _ in range(5):
+            score.transpose(1)
+        
+        depth = len(score._undo_stack)
+        assert 1 < depth < 6
+        assert score._undo_bytes <= score._max_undo_bytes
+        assert score._undo_bytes == sum(len(s) for s in score._undo_stack)
+        
+        for _ in range(depth):
+            assert score.undo() is True
+        assert score.undo() is False
+        assert score._undo_bytes == 0
+        
+        assert score.redo() is True
+        assert score.can_redo() is True
 
 
 class TestOperations:
@@ -136,6 +274,135 @@ class TestOperations:
         assert pitch_to_midi("A4") == 69
 
 
+class TestTemplates:
+    """Tests for score templates."""
+    
+    def test_template_dict_round_trip(self):
+        """Test serializing and restoring a template."""
+        from sheet_music_scanner.core.templates import (
+            PartTemplate, ScoreTemplate, TemplateCategory
+        )
+        
+        template = ScoreTemplate(
+            name="Duo",
+            description="Two parts",
+            category=TemplateCategory.CUSTOM,
+            key_signature="G major",
+            parts=[
+                PartTemplate(name="Flute", instrument="Flute", midi_program=73),
+                PartTemplate(name="Cello", clef="bass", transpose=-12),
+            ],
+            is_builtin=False,
+        )
+        
+        data = template.to_dict()
+        assert data["category"] == "Custom"
+        assert data["parts"][1] == {
+            "name": "Cello",
+            "clef": "bass",
+            "instrument": "",
+            "midi_program": 0,
+            "transpose": -12,
+        }
+        
+        assert ScoreTemplate.from_dict(data) == template
+    
+    def test_create_score_from_template(self):
+        """Test building a music21 score from a builtin template."""
+        from sheet_music_scanner.core.templates import get_template_manager
+        from music21 import clef, instrument
+        
+        template = get_template_manager().get_by_name("String Quartet")
+        m21_score = template.create_score()
+        
+        assert m21_score.metadata.title == "String Quartet"
+        assert len(m21_score.parts) == 4
+        
+        viola = m21_score.parts[2]
+        assert viola.partName == "Viola"
+        assert isinstance(viola.recurse().getElementsByClass(clef.Clef)[0], clef.AltoClef)
+        assert isinstance(viola.getElementsByClass(instrument.Instrument)[0], instrument.Viola)
+    
+    def test_create_score_key_signature(self):
+        """Test template key strings like "Bb major" are applied."""
+        import dataclasses
+        from sheet_music_scanner.core.templates import get_template_manager
+        from music21 import key
+        
+        template = get_template_manager().get_by_name("Piano Score")
+        for signature, expected in (("Bb major", -2), ("e minor", 1), ("bogus", 0)):
+            m21_score = dataclasses.replace(template, key_signature=signature).create_score()
+            keys = [p.recurse().getElementsByClass(key.Key)[0] for p in m21_score.parts]
+            assert [k.sharps for k in keys] == [expected, expected]
+            assert keys[0] is not keys[1]
+    
+    def test_custom_templates_persist(self):
+        """Test custom templates are saved and reloaded."""
+        from sheet_music_scanner.core.templates import (
+            PartTemplate, ScoreTemplate, TemplateCategory, TemplateManager
+        )
+        
+        templates_dir = Path(tempfile.mkdtemp())
+        manager = TemplateManager(custom_templates_dir=templates_dir)
+        manager.add_custom_template(ScoreTemplate(
+            name="Trio",
+            description="Three parts",
+            category=TemplateCategory.ENSEMBLE,
+            parts=[PartTemplate(name=f"Part {i}") for i in range(3)],
+        ))
+        
+        assert (templates_dir / "templates.json").exists()
+        
+        reloaded = TemplateManager(custom_templates_dir=templates_dir)
+        assert reloaded.custom_templates == manager.custom_templates
+        assert reloaded.custom_templates[0].category == TemplateCategory.CUSTOM
+        assert reloaded.get_by_name("trio") is not None
+    
+    def test_custom_templates_bulk_replace_remove(self):
+        """Test bulk adding, replacing and removing custom templates."""
+        from sheet_music_scanner.core.templates import (
+            ScoreTemplate, TemplateCategory, TemplateManager
+        )
+        
+        manager = TemplateManager()
+        revision = manager.revision
+        manager.add_custom_templates_bulk([
+            ScoreTemplate(name=name, description="", category=TemplateCategory.SOLO)
+            for name in ("One", "Two", "Three")
+        ])
+        assert [t.name for t in manager.custom_templates] == ["One", "Two", "Three"]
+        
+        manager.add_custom_template(ScoreTemplate(
+            name="one", description="replaced", category=TemplateCategory.SOLO
+        ))
+        assert [t.name for t in manager.custom_templates] == ["Two", "Three", "one"]
+        assert manager.custom_templates[-1].category == TemplateCategory.CUSTOM
+        
+        assert manager.get_by_name("ONE").description == "replaced"
+        assert manager.get_by_name("two").name == "Two"
+        
+        assert manager.revision != revision
+        
+        assert manager.remove_custom_template("TWO") is True
+        revision = manager.revision
+        assert manager.remove_custom_template("Two") is False
+        assert manager.revision == revision
+        assert manager.get_by_name("two") is None
+        assert len(manager.all_templates) == len(manager.builtin_templates) + 2
+        
+        custom = manager.get_by_category(TemplateCategory.CUSTOM)
+        assert [t.name for t in custom] == ["Three", "one"]
+        manager.add_custom_template(ScoreTemplate(
+            name="Four", description="", category=TemplateCategory.SOLO
+        ))
+        custom = manager.get_by_category(TemplateCategory.CUSTOM)
+        assert [t.name for t in custom] == ["Three", "one", "Four"]
+        assert all(
+            t.category == TemplateCategory.SOLO
+            for t in manager.get_by_category(TemplateCategory.SOLO)
+        )
+
+
 class TestConfig:
     """Tests for configuration."""
     
@@ -169,6 +436,140 @@ class TestConfig:
         loaded = Config.load()
         # Note: This creates a new config at default location
         # For proper testing we'd need to mock the config path
+    
+    def test_config_batch_update(self):
+        """Test batch_update writes the config once, on exit."""
+        from sheet_music_scanner.config import Config
+        
+        config = Config()
+        config._config_dir = Path(tempfile.mkdtemp())
+        config._config_file = config._config_dir / "config.json"
+        
+        with config.batch_update():
+            config.gui.theme = "dark"
+            config.add_recent_file("score.musicxml")
+            assert not config._config_file.exists()
+        
+        assert config._config_file.exists()
+        assert '"dark"' in config._config_file.read_text()
+
+
+class TestBatchProcessor:
+    """Tests for batch processing."""
+    
+    def test_process_omr_async_missing_files(self):
+        """Test concurrent batch OMR reports every item."""
+        import asyncio
+        from sheet_music_scanner.core.batch_processor import (
+            BatchProcessor, BatchJobStatus
+        )
+        
+        processor = BatchProcessor(max_workers=2)
+        tmpdir = Path(tempfile.mkdtemp())
+        processor.add_files([tmpdir / f"missing_{i}.png" for i in range(3)])
+        
+        completed = []
+        processor.set_callbacks(on_item_completed=lambda i, item: completed.append(i))
+        
+        result = asyncio.run(processor.process_omr_async())
+        
+        assert result.total_items == 3
+        assert result.failed == 3
+        assert sorted(completed) == [0, 1, 2]
+        assert all(item.status == BatchJobStatus.FAILED for item in result.items)
+        assert not processor.is_running
+    
+    def test_in_process_engine_runs_serially(self, monkeypatch):
+        """Test batch concurrency drops to one when oemer runs in-process."""
+        import asyncio
+        import threading
+        import time
+        from sheet_music_scanner.core import batch_processor
+        from sheet_music_scanner.core.batch_processor import (
+            BatchProcessor, BatchJobStatus
+        )
+        
+        lock = threading.Lock()
+        active = []
+        peak = []
+        
+        def fake_item(self, processor, i, item):
+            with lock:
+                active.append(i)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(i)
+            item.status = BatchJobStatus.COMPLETED
+        
+        monkeypatch.setattr(BatchProcessor, "_process_omr_item", fake_item)
+        monkeypatch.setattr(
+            "sheet_music_scanner.omr.processor.OMRProcessor.__init__",
+            lambda self, **kwargs: None,
+        )
+        
+        for in_process, expected_peak in ((True, 1), (False, 2)):
+            monkeypatch.setattr(batch_processor, "_omr_runs_in_process", lambda: in_process)
+            peak.clear()
+            
+            processor = BatchProcessor(max_workers=2)
+            processor.add_files([Path(f"page_{i}.png") for i in range(4)], validate=False)
+            result = asyncio.run(processor.process_omr_async())
+            
+            assert result.completed == 4
+            assert max(peak) == expected_peak
+    
+    def test_add_files_validate(self):
+        """Test missing files are marked failed unless validation is skipped."""
+        from sheet_music_scanner.core.batch_processor import (
+            BatchProcessor, BatchJobStatus
+        )
+        
+        tmpdir = Path(tempfile.mkdtemp())
+        existing = tmpdir / "page.png"
+        existing.write_bytes(b"")
+        missing = tmpdir / "missing.png"
+        
+        processor = BatchProcessor()
+        processor.add_files([existing, missing])
+        statuses = [item.status for item in processor.items]
+        assert statuses == [BatchJobStatus.PENDING, BatchJobStatus.FAILED]
+        assert "not found" in processor.items[1].error_message
+        assert processor.items[1].display_name == "missing.png"
+        
+        processor.clear()
+        processor.add_files([missing], validate=False)
+        assert processor.items[0].status == BatchJobStatus.PENDING
+    
+    def test_requeue_resets_items(self):
+        """Test re-queued items start over and missing files are re-checked."""
+        from sheet_music_scanner.core.batch_processor import (
+            BatchProcessor, BatchJobStatus
+        )
+        
+        tmpdir = Path(tempfile.mkdtemp())
+        first = tmpdir / "first.png"
+        first.write_bytes(b"")
+        second = tmpdir / "second.png"
+        
+        processor = BatchProcessor()
+        processor.add_files([first, second])
+        assert processor.items[1].status == BatchJobStatus.FAILED
+        
+        # The missing file reappears; a finished item is started over
+        second.write_bytes(b"")
+        processor.items[0].status = BatchJobStatus.COMPLETED
+        processor.requeue()
+        statuses = [item.status for item in processor.items]
+        assert statuses == [BatchJobStatus.PENDING, BatchJobStatus.PENDING]
+        assert processor.items[1].error_message is None
+        
+        first.unlink()
+        processor.requeue()
+        assert processor.items[0].status == BatchJobStatus.FAILED
+        
+        processor.remove_items([0])
+        assert [item.input_path for item in processor.items] == [second]
 
 
 class TestExporters:
@@ -186,6 +587,80 @@ class TestExporters:
         exporter = MidiExporter(options)
         assert exporter.options.velocity == 100
         assert exporter.options.tempo == 140
+        
+        # Non-positive tempo means "keep the score tempo"
+        assert MidiExportOptions(tempo=0).tempo is None
+    
+    def test_midi_export_with_mido(self):
+        """Test mido export applies the velocity override."""
+        mido = pytest.importorskip("mido")
+        from sheet_music_scanner.core.score import Score
+        from sheet_music_scanner.export.midi_exporter import (
+            MidiExporter, MidiExportOptions
+        )
+        from music21 import stream, note
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        measure = stream.Measure(number=1)
+        for pitch in ("C4", "E4", "G4", "C5"):
+            measure.append(note.Note(pitch, quarterLength=1.0))
+        part.append(measure)
+        m21_score.append(part)
+        
+        output_dir = Path(tempfile.mkdtemp())
+        exporter = MidiExporter(MidiExportOptions(velocity=100))
+        output_path = exporter.export_with_mido(
+            Score.from_music21(m21_score), output_dir / "out"
+        )
+        
+        assert output_path.suffix == ".mid"
+        velocities = [
+            msg.velocity
+            for track in mido.MidiFile(str(output_path)).tracks
+            for msg in track
+            if msg.type == "note_on" and msg.velocity > 0
+        ]
+        assert velocities == [100, 100, 100, 100]
+    
+    def test_midi_export_velocity_and_tempo(self):
+        """Test velocity and tempo overrides apply to the MIDI file only."""
+        mido = pytest.importorskip("mido")
+        from sheet_music_scanner.core.score import Score
+        from sheet_music_scanner.export.midi_exporter import (
+            MidiExporter, MidiExportOptions
+        )
+        from music21 import stream, note, tempo
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        measure = stream.Measure(number=1)
+        measure.append(tempo.MetronomeMark(number=90))
+        for pitch in ("C4", "E4", "G4", "C5"):
+            measure.append(note.Note(pitch, quarterLength=1.0))
+        part.append(measure)
+        m21_score.append(part)
+        score = Score.from_music21(m21_score)
+        musicxml_before = score.musicxml_bytes
+        
+        output_dir = Path(tempfile.mkdtemp())
+        exporter = MidiExporter(MidiExportOptions(velocity=110, tempo=140))
+        output_path = exporter.export(score, output_dir / "out.mid")
+        
+        messages = [msg for track in mido.MidiFile(str(output_path)).tracks for msg in track]
+        velocities = [
+            msg.velocity for msg in messages
+            if msg.type == "note_on" and msg.velocity > 0
+        ]
+        assert velocities == [110, 110, 110, 110]
+        tempos = {round(mido.tempo2bpm(msg.tempo)) for msg in messages if msg.type == "set_tempo"}
+        assert tempos == {140}
+        
+        # The source score keeps its own volumes and tempo
+        assert all(n.volume.velocity is None for n in m21_score.recurse().notes)
+        marks = list(m21_score.recurse().getElementsByClass(tempo.MetronomeMark))
+        assert [mark.number for mark in marks] == [90]
+        assert score.musicxml_bytes is musicxml_before
     
     def test_musicxml_exporter_creation(self):
         """Test creating MusicXML exporter."""
@@ -194,12 +669,189 @@ class TestExporters:
         exporter = MusicXMLExporter()
         assert exporter is not None
     
+    def test_musicxml_export_to_bytes(self):
+        """Test in-memory MusicXML export."""
+        from sheet_music_scanner.core.score import Score
+        from sheet_music_scanner.export import MusicXMLExporter
+        from music21 import stream, note
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        measure = stream.Measure(number=1)
+        measure.append(note.Note("C4", quarterLength=4.0))
+        part.append(measure)
+        m21_score.append(part)
+        score = Score.from_music21(m21_score)
+        
+        exporter = MusicXMLExporter()
+        data = exporter.export_to_bytes(score)
+        
+        assert isinstance(data, bytes)
+        assert b"score-partwise" in data
+        assert data.startswith(b"<?xml")
+        assert exporter.export_to_string(score).startswith("<?xml")
+    
     def test_pdf_exporter_creation(self):
         """Test creating PDF exporter."""
         from sheet_music_scanner.export import PDFExporter
         
         exporter = PDFExporter()
         assert exporter is not None
+    
+    def test_pdf_export_many_empty(self):
+        """Test batch PDF export with nothing to do."""
+        from sheet_music_scanner.export import PDFExporter
+        
+        assert PDFExporter().export_many([]) == []
+    
+    def test_lilypond_template(self):
+        """Test direct LilyPond source generation and its fallback."""
+        from sheet_music_scanner.export.ly_template import render_lilypond
+        from music21 import stream, note, chord, key, meter
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        measure = stream.Measure(number=1)
+        measure.append(key.Key("E-"))
+        measure.append(meter.TimeSignature("3/4"))
+        measure.append(note.Note("E-4", quarterLength=1.5))
+        measure.append(note.Note("F#5", quarterLength=0.5))
+        measure.append(chord.Chord(["C3", "G3"], quarterLength=1.0))
+        part.append(measure)
+        m21_score.append(part)
+        
+        ly_text = render_lilypond(m21_score, title="Test")
+        assert 'title = "Test"' in ly_text
+        assert "\\key ees \\major \\time 3/4 ees'4. fis''8 <c g>4 |" in ly_text
+        
+        # Tuplets are not handled by the template
+        measure.append(note.Note("C4", quarterLength=1 / 3))
+        assert render_lilypond(m21_score) is None
+    
+    def test_lilypond_template_unsupported(self):
+        """Test unpitched notes and dotted tempo referents fall back."""
+        from sheet_music_scanner.export.ly_template import render_lilypond
+        from music21 import stream, note, meter, tempo, duration
+        
+        def single_measure_score(*elements):
+            m21_score = stream.Score()
+            part = stream.Part()
+            measure = stream.Measure(number=1)
+            for element in elements:
+                measure.append(element)
+            part.append(measure)
+            m21_score.append(part)
+            return m21_score
+        
+        quarter_mark = tempo.MetronomeMark(number=90)
+        assert "\\tempo 4 = 90" in render_lilypond(single_measure_score(
+            meter.TimeSignature("4/4"), quarter_mark, note.Note("C4", quarterLength=4.0)
+        ))
+        
+        dotted_mark = tempo.MetronomeMark(
+            number=60, referent=duration.Duration(1.5)
+        )
+        assert render_lilypond(single_measure_score(
+            meter.TimeSignature("6/8"), dotted_mark, note.Note("C4", quarterLength=3.0)
+        )) is None
+        
+        assert render_lilypond(single_measure_score(
+            note.Unpitched(quarterLength=4.0)
+        )) is None
+    
+    @pytest.mark.skipif(os.name != "posix", reason="uses POSIX shell tools")
+    def test_renderer_stall_timeout(self):
+        """Test renderer runs are killed only when output stalls."""
+        import subprocess
+        from sheet_music_scanner.export.pdf_exporter import _run_tool
+        
+        result = _run_tool(
+            ["sh", "-c", "for i in 1 2 3; do echo $i; sleep 0.4; done"],
+            stall_timeout=1.0
+        )
+        assert result.stdout.split() == ["1", "2", "3"]
+        
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_tool(["sleep", "5"], stall_timeout=0.5)
+    
+    def test_pdf_export_cache_hit(self):
+        """Test an unchanged score is served from the PDF cache."""
+        import importlib.util
+        from sheet_music_scanner.core.score import Score
+        from sheet_music_scanner.export import PDFExporter
+        from sheet_music_scanner.export.pdf_exporter import PDFRenderer
+        from music21 import stream, note
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        part.append(note.Note("C4", quarterLength=4.0))
+        m21_score.append(part)
+        score = Score.from_music21(m21_score)
+        
+        exporter = PDFExporter()
+        exporter._pdf_cache_dir = Path(tempfile.mkdtemp())
+        renderer = exporter._resolve_renderer()
+        
+        # Part ids differ per serialization but must not change the key
+        key = exporter._cache_key(score.to_musicxml_bytes(), renderer)
+        assert exporter._cache_key(score.to_musicxml_bytes(), renderer) == key
+        
+        (exporter._pdf_cache_dir / f"{key}.pdf").write_bytes(b"%PDF-cached")
+        output_path = exporter.export(score, Path(tempfile.mkdtemp()) / "out")
+        
+        assert output_path.suffix == ".pdf"
+        assert output_path.read_bytes() == b"%PDF-cached"
+        
+        # An edit made straight on the music21 score must miss the cache
+        # instead of reusing the earlier PDF
+        m21_score.parts[0].notes[0].transpose(2, inPlace=True)
+        assert exporter._cache_key(score.to_musicxml_bytes(), renderer) != key
+        
+        # A failed render leaves the existing output untouched
+        if renderer == PDFRenderer.VEROVIO and importlib.util.find_spec("verovio") is None:
+            with pytest.raises(RuntimeError):
+                exporter.export(score, output_path)
+            assert output_path.read_bytes() == b"%PDF-cached"
+            assert [p.name for p in output_path.parent.iterdir()] == ["out.pdf"]
+    
+    def test_pdf_export_async_uses_cache(self):
+        """Test concurrent exports share the PDF cache and its atomic write."""
+        import asyncio
+        from sheet_music_scanner.core.score import Score
+        from sheet_music_scanner.export import PDFExporter
+        from music21 import stream, note
+        
+        m21_score = stream.Score()
+        part = stream.Part()
+        part.append(note.Note("G4", quarterLength=4.0))
+        m21_score.append(part)
+        score = Score.from_music21(m21_score)
+        
+        exporter = PDFExporter()
+        exporter._pdf_cache_dir = Path(tempfile.mkdtemp())
+        key = exporter._cache_key(score.to_musicxml_bytes(), exporter._resolve_renderer())
+        (exporter._pdf_cache_dir / f"{key}.pdf").write_bytes(b"%PDF-cached")
+        
+        output_dir = Path(tempfile.mkdtemp())
+        paths = asyncio.run(exporter.export_async_many([(score, output_dir / "out")]))
+        
+        assert paths == [output_dir / "out.pdf"]
+        assert paths[0].read_bytes() == b"%PDF-cached"
+        assert [p.name for p in output_dir.iterdir()] == ["out.pdf"]
+    
+    def test_pdf_cache_trim(self):
+        """Test the PDF cache drops its least recently used entries first."""
+        from sheet_music_scanner.export import PDFExporter
+        
+        exporter = PDFExporter()
+        cache_dir = exporter._pdf_cache_dir = Path(tempfile.mkdtemp())
+        for i, name in enumerate(["old", "mid", "new"]):
+            entry = cache_dir / f"{name}.pdf"
+            entry.write_bytes(b"x" * 100)
+            os.utime(entry, (1000 + i, 1000 + i))
+        
+        exporter._trim_cache(max_bytes=250)
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["mid.pdf", "new.pdf"]
 
 
 class TestImageProcessing: